@@ -11,10 +11,107 @@ Usage:
 """
 
 import json
+import re
+import sys
 import argparse
+from collections import defaultdict
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+
+try:
+    import orjson  # Optional fast JSON parser/serializer
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional streaming JSON parser
+except ImportError:
+    ijson = None
+
+# Separator for comma-delimited merit badge lists, absorbing surrounding whitespace
+BADGE_LIST_SPLIT = re.compile(r'\s*,\s*')
+
+# MBC files at least this large are streamed with ijson rather than parsed whole
+MBC_STREAM_MIN_BYTES = 32 * 1024 * 1024
+
+# ijson prefixes of the counselor records within an MBC data file
+COUNSELOR_ITEM_PREFIXES = frozenset({'troop_counselors.item', 'supplemental_counselors.item'})
+
+# Stem of timestamped demand analysis files written by scout_demand_processor.py
+DEMAND_FILE_TIMESTAMP = re.compile(r'scout_demand_analysis_\d{8}_\d{6}')
+
+
+class GapLevel(IntEnum):
+    """Coverage gap classification, ordered from most to least urgent"""
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+    ADEQUATE = 4
+
+
+# Standard 13 Eagle-required merit badges (as of 2023)
+EAGLE_REQUIRED_BADGES = frozenset({
+    'Camping', 'Citizenship in Community', 'Citizenship in the Nation',
+    'Citizenship in the World', 'Communication', 'Cooking',
+    'Emergency Preparedness', 'Environmental Science', 'Family Life',
+    'First Aid', 'Hiking', 'Personal Fitness', 'Personal Management',
+    'Sustainability'  # Added as alternate to Environmental Science
+})
+
+
+def _describe_gap(gap_level: GapLevel, scout_count: int, counselor_count: int) -> str:
+    """Build the human-readable description for a gap classification"""
+    if gap_level == GapLevel.CRITICAL:
+        if counselor_count == 0:
+            return "Eagle-required Merit Badge with no Merit Badge Counselor (MBC) coverage"
+        return "Only 1 MBC for Eagle-required Merit Badge (busy Troop Committee Chair needs help)"
+    if gap_level == GapLevel.HIGH:
+        return f"{scout_count} or more Scouts requesting non-Eagle Merit Badge with no MBC coverage"
+    if gap_level == GapLevel.MEDIUM:
+        return f"{scout_count} Scout(s) requesting non-Eagle Merit Badge with no MBC coverage"
+    if gap_level == GapLevel.LOW:
+        return "Non-requested, non-Eagle Merit Badge with no MBC coverage"
+    return f"Adequate coverage ({counselor_count} Merit Badge Counselors)"
+
+
+def _score_and_classify_badges(scout_counts: List[int], counselor_counts: List[int],
+                              eagle_multipliers: List[float], eagle_flags: List[bool]) -> Tuple[List[float], List[GapLevel]]:
+    """
+    Score and classify a batch of badges given as parallel columns in one pass
+
+    Priority Score = (Scout Demand × Eagle Multiplier) / (Counselor Count + 1)
+
+    Returns:
+        Tuple of (priority_scores rounded to 2 decimals, gap_levels), aligned with the input columns
+    """
+    priority_scores = []
+    gap_levels = []
+    add_score = priority_scores.append
+    add_gap_level = gap_levels.append
+
+    for scout_count, counselor_count, multiplier, is_eagle in zip(
+            scout_counts, counselor_counts, eagle_multipliers, eagle_flags):
+        add_score(round((scout_count * multiplier) / (counselor_count + 1), 2))
+
+        # Determine gap classification based on Pass 3 feedback definitions
+        # Merit badges with 3+ MBCs are considered adequately covered and not priority
+        if counselor_count >= 3:
+            add_gap_level(GapLevel.ADEQUATE)
+        elif counselor_count <= 1 and is_eagle:
+            add_gap_level(GapLevel.CRITICAL)
+        elif counselor_count == 0 and not is_eagle and scout_count >= 3:
+            add_gap_level(GapLevel.HIGH)
+        elif counselor_count == 0 and not is_eagle and scout_count >= 1:
+            add_gap_level(GapLevel.MEDIUM)
+        elif counselor_count == 0 and not is_eagle and scout_count == 0:
+            add_gap_level(GapLevel.LOW)
+        else:
+            add_gap_level(GapLevel.ADEQUATE)
+
+    return priority_scores, gap_levels
 
 
 class CoverageGapAnalyzer:
@@ -24,6 +121,7 @@ class CoverageGapAnalyzer:
         self.processed_dir = Path(processed_dir)
         self.exclusion_file = Path(exclusion_file)
         self.fully_excluded, self.selective_inclusion = self.load_exclusion_list()
+        self._exclusion_rule_cache: Dict[str, tuple] = {}
 
         # Badge name mapping to handle discrepancies between Scout signup and MBC data
         self.badge_name_mapping = {
@@ -72,7 +170,7 @@ class CoverageGapAnalyzer:
 
         return fully_excluded, selective_inclusion
 
-    def get_exclusion_rule(self, name: str) -> tuple[str, str]:
+    def get_exclusion_rule(self, name: str) -> tuple[str, Optional[str]]:
         """
         Get exclusion rule for a counselor name using smart matching
 
@@ -88,30 +186,36 @@ class CoverageGapAnalyzer:
         if not name:
             return ('none', None)
 
-        # Normalize the full name
+        # Same name may appear in both troop and supplemental counselor lists
+        cached_rule = self._exclusion_rule_cache.get(name)
+        if cached_rule is not None:
+            return cached_rule
+
+        rule = self._match_exclusion_rule(name)
+        self._exclusion_rule_cache[name] = rule
+        return rule
+
+    def _match_exclusion_rule(self, name: str) -> tuple[str, Optional[str]]:
+        """Match a non-empty counselor name against the exclusion rules (uncached)"""
+        # Normalize the full name into lookup keys
         name_lower = name.lower()
         name_parts = name_lower.split()
 
-        # Helper function to check if normalized name matches
-        def matches_normalized(excluded_name):
-            # Exact match after normalization
-            if excluded_name == name_lower.replace(' ', ''):
-                return True
-            # First + last name match (ignoring middle names/initials)
-            if len(name_parts) >= 2:
-                first_last = f"{name_parts[0]}{name_parts[-1]}"
-                if excluded_name == first_last:
-                    return True
-            return False
+        # Exact match after normalization
+        name_keys = [name_lower.replace(' ', '')]
+        # First + last name match (ignoring middle names/initials)
+        if len(name_parts) >= 2:
+            name_keys.append(f"{name_parts[0]}{name_parts[-1]}")
 
         # Check fully excluded names
-        for excluded in self.fully_excluded:
-            if matches_normalized(excluded):
+        for key in name_keys:
+            if key in self.fully_excluded:
                 return ('full', None)
 
         # Check selective inclusion names
-        for excluded_name, allowed_badge in self.selective_inclusion.items():
-            if matches_normalized(excluded_name):
+        for key in name_keys:
+            allowed_badge = self.selective_inclusion.get(key)
+            if allowed_badge is not None:
                 return ('selective', allowed_badge)
 
         return ('none', None)
@@ -129,8 +233,12 @@ class CoverageGapAnalyzer:
         demand_files = list(self.processed_dir.glob("scout_demand_analysis_*.json"))
         demand_file = None
         if demand_files:
-            demand_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            demand_file = demand_files[0]
+            # Filenames embed a YYYYMMDD_HHMMSS timestamp that sorts lexicographically;
+            # only stat the files when a name doesn't follow that format
+            if all(DEMAND_FILE_TIMESTAMP.fullmatch(f.stem) for f in demand_files):
+                demand_file = max(demand_files, key=lambda f: f.name)
+            else:
+                demand_file = max(demand_files, key=lambda f: f.stat().st_mtime)
             print(f"📊 Found demand analysis: {demand_file.name}")
 
         # Find MBC data file
@@ -143,76 +251,113 @@ class CoverageGapAnalyzer:
 
         return demand_file, mbc_file
 
+    def _load_json(self, json_file: Path) -> Dict:
+        """Load a JSON file, using orjson when available"""
+        if orjson is not None:
+            with open(json_file, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
     def load_demand_data(self, demand_file: Path) -> Dict:
         """Load Scout demand analysis data"""
-        with open(demand_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._load_json(demand_file)
 
     def load_mbc_data(self, mbc_file: Path) -> Dict:
         """Load MBC coverage data"""
-        with open(mbc_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._load_json(mbc_file)
+
+    def iter_mbc_counselors(self, mbc_file: Path) -> Iterator[Dict]:
+        """
+        Stream troop counselors followed by supplemental counselors from MBC data
 
-    def extract_mbc_coverage(self, mbc_data: Dict) -> Dict[str, List[Dict]]:
+        Files under MBC_STREAM_MIN_BYTES (or any file when ijson is unavailable) are
+        parsed whole via _load_json, since orjson outpaces ijson's per-event overhead
+        at that size. Larger files are streamed in a single ijson pass that builds only
+        the counselor records; roster_processor.py writes troop_counselors before
+        supplemental_counselors, so file order is already the yield order.
+        """
+        if ijson is None or mbc_file.stat().st_size < MBC_STREAM_MIN_BYTES:
+            mbc_data = self.load_mbc_data(mbc_file)
+            yield from mbc_data.get('troop_counselors', [])
+            yield from mbc_data.get('supplemental_counselors', [])
+            return
+
+        with open(mbc_file, 'rb') as f:
+            builder = None
+            depth = 0
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is None:
+                    if event != 'start_map' or prefix not in COUNSELOR_ITEM_PREFIXES:
+                        continue
+                    builder = ijson.ObjectBuilder()
+
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                    if depth == 0:
+                        yield builder.value
+                        builder = None
+
+    def extract_mbc_coverage(self, all_counselors: Iterable[Dict]) -> Dict[str, Dict]:
         """
         Extract merit badge coverage from MBC data
 
         Args:
-            mbc_data: Loaded MBC join data
+            all_counselors: Troop and supplemental counselor records (see iter_mbc_counselors)
 
         Returns:
-            Dict mapping badge_name -> list of counselor info
+            Dict mapping badge_name -> {'counselors': list of counselor info, 'count': number of counselors}
         """
-        badge_coverage = {}
-
-        # Process both troop counselors and supplemental counselors
-        all_counselors = (
-            mbc_data.get('troop_counselors', []) +
-            mbc_data.get('supplemental_counselors', [])
-        )
+        badge_coverage = defaultdict(list)
 
         excluded_count = 0
         selective_count = 0
 
+        # Local bindings for the per-counselor loop
+        intern = sys.intern
+        split_badges = BADGE_LIST_SPLIT.split
+        get_exclusion_rule = self.get_exclusion_rule
+
         for counselor in all_counselors:
-            counselor_name = counselor.get('name', '')
+            get = counselor.get
+            counselor_name = get('name', '')
 
             # Check exclusion rule for this counselor
-            rule_type, allowed_badge = self.get_exclusion_rule(counselor_name)
+            rule_type, allowed_badge = get_exclusion_rule(counselor_name)
 
             # Handle full exclusion
             if rule_type == 'full':
                 excluded_count += 1
                 continue
 
+            # Intern short values repeated across many counselors so records share one string
             counselor_info = {
                 'name': counselor_name,
-                'troops': counselor.get('troops', []),
-                'troop_display': counselor.get('troop_display', ''),
-                'email': counselor.get('email', ''),
-                'phone': counselor.get('phone', ''),
-                'source': counselor.get('source', 'roster')
+                'troops': get('troops', []),
+                'troop_display': intern(get('troop_display', '')),
+                'email': get('email', ''),
+                'phone': get('phone', ''),
+                'source': intern(get('source', 'roster'))
             }
 
             # Parse merit badges list
-            merit_badges_str = counselor.get('merit_badges', '')
+            merit_badges_str = get('merit_badges', '')
             if merit_badges_str:
-                badges = [badge.strip() for badge in merit_badges_str.split(',')]
+                badges = [intern(badge) for badge in split_badges(merit_badges_str.strip())]
 
                 # Handle selective inclusion
                 if rule_type == 'selective':
                     # Only include the allowed badge
                     if allowed_badge in badges:
-                        if allowed_badge not in badge_coverage:
-                            badge_coverage[allowed_badge] = []
                         badge_coverage[allowed_badge].append(counselor_info)
                         selective_count += 1
                 else:
                     # Include all badges (no exclusion)
                     for badge in badges:
                         if badge:
-                            if badge not in badge_coverage:
-                                badge_coverage[badge] = []
                             badge_coverage[badge].append(counselor_info)
 
         if excluded_count > 0:
@@ -220,22 +365,16 @@ class CoverageGapAnalyzer:
         if selective_count > 0:
             print(f"🎯 Applied {selective_count} selective inclusions (counselors limited to specific badges)")
         print(f"📋 Extracted coverage for {len(badge_coverage)} merit badges")
-        return badge_coverage
+        return {
+            badge: {'counselors': counselors, 'count': len(counselors)}
+            for badge, counselors in badge_coverage.items()
+        }
 
     def _is_eagle_required_badge(self, badge_name: str) -> bool:
         """Check if a badge is Eagle-required based on known Eagle badge list"""
-        # Standard 13 Eagle-required merit badges (as of 2023)
-        eagle_required_badges = {
-            'Camping', 'Citizenship in Community', 'Citizenship in the Nation',
-            'Citizenship in the World', 'Communication', 'Cooking',
-            'Emergency Preparedness', 'Environmental Science', 'Family Life',
-            'First Aid', 'Hiking', 'Personal Fitness', 'Personal Management',
-            'Sustainability'  # Added as alternate to Environmental Science
-        }
-
         # Apply name mapping and check
-        mapped_name = self.badge_name_mapping.get(badge_name, badge_name)
-        return badge_name in eagle_required_badges or mapped_name in eagle_required_badges
+        return (badge_name in EAGLE_REQUIRED_BADGES or
+                self.badge_name_mapping.get(badge_name, badge_name) in EAGLE_REQUIRED_BADGES)
 
     def calculate_priority_scores(self, demand_data: Dict, coverage_data: Dict) -> List[Dict]:
         """
@@ -246,136 +385,104 @@ class CoverageGapAnalyzer:
 
         Args:
             demand_data: Scout demand analysis data
-            coverage_data: MBC coverage data
+            coverage_data: MBC coverage data (see extract_mbc_coverage)
 
         Returns:
-            List of priority analysis records
+            List of priority analysis records, gap_level held as GapLevel for bucketing
         """
-        badge_priorities = []
         badge_demand = demand_data.get('badge_demand', {})
 
         # Get all Eagle-required badges from demand data for Pass 4 Critical Priority logic
         eagle_badges_in_demand = {name: info for name, info in badge_demand.items()
                                  if info.get('is_eagle_required', False)}
 
-        # Process ALL coverage data to find Eagle badges with 0-1 MBC (Pass 4 requirement)
-        all_eagle_badges_with_limited_coverage = {}
-        for badge_name, counselors in coverage_data.items():
-            counselor_count = len(counselors)
-            if counselor_count <= 1:  # 0 or 1 MBC
+        # Collect candidate badges, then score and classify them in one batch
+        # Each candidate: (badge_name, scout_count, counselors, counselor_count,
+        #                  eagle_multiplier, is_eagle, interested_scouts)
+        candidates = []
+
+        # First add ALL Eagle badges with 0-1 MBC to priorities (Pass 4 requirement)
+        # Pass 4: ALL Eagle badges with 0-1 MBC classify as Critical Priority
+        processed_eagle = set()
+        for badge_name, coverage in coverage_data.items():
+            if coverage['count'] <= 1:  # 0 or 1 MBC
                 # Check if this is an Eagle-required badge by looking it up in demand data or Eagle badge list
                 eagle_info = eagle_badges_in_demand.get(badge_name)
                 if eagle_info or self._is_eagle_required_badge(badge_name):
-                    all_eagle_badges_with_limited_coverage[badge_name] = {
-                        'counselors': counselors,
-                        'counselor_count': counselor_count,
-                        'is_eagle_required': True,
-                        'scout_demand': eagle_info.get('scout_count', 0) if eagle_info else 0,
-                        'interested_scouts': eagle_info.get('interested_scouts', []) if eagle_info else [],
-                        'priority_weight': 1.5
-                    }
-
-        # First add ALL Eagle badges with 0-1 MBC to priorities (Pass 4 requirement)
-        for badge_name, eagle_info in all_eagle_badges_with_limited_coverage.items():
-            counselors = eagle_info['counselors']
-            counselor_count = eagle_info['counselor_count']
-            scout_count = eagle_info['scout_demand']
-
-            # Calculate priority score
-            eagle_multiplier = eagle_info['priority_weight']
-            priority_score = (scout_count * eagle_multiplier) / (counselor_count + 1)
-
-            # Pass 4: ALL Eagle badges with 0-1 MBC are Critical Priority
-            gap_level = "CRITICAL"
-            if counselor_count == 0:
-                gap_description = "Eagle-required Merit Badge with no Merit Badge Counselor (MBC) coverage"
-            else:
-                gap_description = "Only 1 MBC for Eagle-required Merit Badge (busy Troop Committee Chair needs help)"
-
-            # Create priority record
-            priority_record = {
-                'badge_name': badge_name,
-                'scout_demand': scout_count,
-                'interested_scouts': eagle_info['interested_scouts'],
-                'counselor_count': counselor_count,
-                'counselors': counselors,
-                'is_eagle_required': True,
-                'priority_score': round(priority_score, 2),
-                'gap_level': gap_level,
-                'gap_description': gap_description
-            }
-            badge_priorities.append(priority_record)
+                    candidates.append((
+                        badge_name,
+                        eagle_info.get('scout_count', 0) if eagle_info else 0,
+                        coverage['counselors'],
+                        coverage['count'],
+                        1.5,
+                        True,
+                        eagle_info.get('interested_scouts', []) if eagle_info else []
+                    ))
+                    processed_eagle.add(badge_name)
 
         # Then process Scout-requested badges
+        map_badge_name = self.badge_name_mapping.get
         for badge_name, demand_info in badge_demand.items():
             scout_count = demand_info.get('scout_count', 0)
             if scout_count == 0:  # Skip badges with no Scout interest
                 continue
 
             # Skip Eagle badges already processed in Pass 4 Critical Priority logic
-            if badge_name in all_eagle_badges_with_limited_coverage:
+            if badge_name in processed_eagle:
                 continue
 
             # Apply name mapping to handle discrepancies
-            mbc_badge_name = self.badge_name_mapping.get(badge_name, badge_name)
+            mbc_badge_name = map_badge_name(badge_name, badge_name)
             if mbc_badge_name != badge_name:
                 print(f"🔄 Name mapping: '{badge_name}' → '{mbc_badge_name}'")
 
             # Get coverage info using mapped name
-            counselors = coverage_data.get(mbc_badge_name, [])
-            counselor_count = len(counselors)
-
-            # Calculate priority score
-            eagle_multiplier = demand_info.get('priority_weight', 1.0)
-            priority_score = (scout_count * eagle_multiplier) / (counselor_count + 1)
-
-            # Determine gap classification based on Pass 3 feedback definitions
-            is_eagle = demand_info.get('is_eagle_required', False)
-
-            # Merit badges with 3+ MBCs are considered adequately covered and not priority
-            if counselor_count >= 3:
-                gap_level = "ADEQUATE"
-                gap_description = f"Adequate coverage ({counselor_count} Merit Badge Counselors)"
-            elif (counselor_count == 0 and is_eagle) or (counselor_count == 1 and is_eagle):
-                gap_level = "CRITICAL"
-                if counselor_count == 0:
-                    gap_description = "Eagle-required Merit Badge with no Merit Badge Counselor (MBC) coverage"
-                else:
-                    gap_description = "Only 1 MBC for Eagle-required Merit Badge (busy Troop Committee Chair needs help)"
-            elif (scout_count >= 3 and not is_eagle and counselor_count == 0):
-                gap_level = "HIGH"
-                gap_description = f"{scout_count} or more Scouts requesting non-Eagle Merit Badge with no MBC coverage"
-            elif (scout_count >= 1 and scout_count <= 2 and not is_eagle and counselor_count == 0):
-                gap_level = "MEDIUM"
-                gap_description = f"{scout_count} Scout(s) requesting non-Eagle Merit Badge with no MBC coverage"
-            elif counselor_count == 0 and not is_eagle and scout_count == 0:
-                gap_level = "LOW"
-                gap_description = "Non-requested, non-Eagle Merit Badge with no MBC coverage"
-            else:
-                gap_level = "ADEQUATE"
-                gap_description = f"Adequate coverage ({counselor_count} Merit Badge Counselors)"
+            coverage = coverage_data.get(mbc_badge_name)
+            candidates.append((
+                badge_name,
+                scout_count,
+                coverage['counselors'] if coverage else [],
+                coverage['count'] if coverage else 0,
+                demand_info.get('priority_weight', 1.0),
+                demand_info.get('is_eagle_required', False),
+                demand_info.get('interested_scouts', [])
+            ))
+
+        scout_counts = [candidate[1] for candidate in candidates]
+        counselor_counts = [candidate[3] for candidate in candidates]
+        eagle_multipliers = [candidate[4] for candidate in candidates]
+        eagle_flags = [candidate[5] for candidate in candidates]
+        priority_scores, gap_levels = _score_and_classify_badges(
+            scout_counts, counselor_counts, eagle_multipliers, eagle_flags
+        )
 
-            # Create priority record
-            priority_record = {
+        # Sort by Eagle status first (Eagle badges supersede non-Eagle), then priority score
+        sort_keys = [
+            (
+                not eagle_flags[i],    # Eagle badges first (False sorts before True)
+                -priority_scores[i],   # Higher priority score first within same Eagle status
+                candidate[0]           # Alphabetical as tiebreaker
+            )
+            for i, candidate in enumerate(candidates)
+        ]
+        sorted_order = sorted(range(len(candidates)), key=sort_keys.__getitem__)
+
+        # Create priority records in sorted order
+        badge_priorities = []
+        for i in sorted_order:
+            badge_name, scout_count, counselors, counselor_count, _, is_eagle, interested_scouts = candidates[i]
+            gap_level = gap_levels[i]
+            badge_priorities.append({
                 'badge_name': badge_name,
                 'scout_demand': scout_count,
-                'interested_scouts': demand_info.get('interested_scouts', []),
+                'interested_scouts': interested_scouts,
                 'counselor_count': counselor_count,
                 'counselors': counselors,
-                'is_eagle_required': demand_info.get('is_eagle_required', False),
-                'priority_score': round(priority_score, 2),
-                'gap_level': gap_level,
-                'gap_description': gap_description
-            }
-
-            badge_priorities.append(priority_record)
-
-        # Sort by Eagle status first (Eagle badges supersede non-Eagle), then priority score
-        badge_priorities.sort(key=lambda x: (
-            not x['is_eagle_required'],  # Eagle badges first (False sorts before True)
-            -x['priority_score'],         # Higher priority score first within same Eagle status
-            x['badge_name']               # Alphabetical as tiebreaker
-        ))
+                'is_eagle_required': is_eagle,
+                'priority_score': priority_scores[i],
+                'gap_level': gap_level,  # Named once analysis is complete (see analyze_coverage_gaps)
+                'gap_description': _describe_gap(gap_level, scout_count, counselor_count)
+            })
 
         print(f"🎯 Analyzed {len(badge_priorities)} badges with Scout demand")
         return badge_priorities
@@ -384,28 +491,37 @@ class CoverageGapAnalyzer:
     def generate_coverage_analysis(self, priority_data: List[Dict]) -> Dict:
         """Generate summary analysis of coverage gaps"""
 
-        # Categorize by gap level
-        critical_gaps = [p for p in priority_data if p['gap_level'] == 'CRITICAL']
-        high_gaps = [p for p in priority_data if p['gap_level'] == 'HIGH']
-        medium_gaps = [p for p in priority_data if p['gap_level'] == 'MEDIUM']
-        low_gaps = [p for p in priority_data if p['gap_level'] == 'LOW']
-        adequate_gaps = [p for p in priority_data if p['gap_level'] == 'ADEQUATE']
+        # Categorize by gap level, accumulating demand in a single pass
+        # Buckets are indexed directly by GapLevel value
+        gaps_by_level = [[] for _ in GapLevel]
+        demand_by_level = [0] * len(GapLevel)
+        top_priorities = []
+        for p in priority_data:
+            gap_level = p['gap_level']
+            gaps_by_level[gap_level].append(p)
+            demand_by_level[gap_level] += p['scout_demand']
 
-        # Eagle vs Non-Eagle breakdown
-        eagle_critical = [p for p in critical_gaps if p['is_eagle_required']]
-        eagle_high = [p for p in high_gaps if p['is_eagle_required']]
+            # Top recruitment targets - only include badges that need recruitment (exclude ADEQUATE)
+            if gap_level != GapLevel.ADEQUATE and len(top_priorities) < 10:  # Top 10 by score
+                top_priorities.append(p)
 
-        # Top recruitment targets - only include badges that need recruitment (exclude ADEQUATE)
-        recruitment_candidates = [p for p in priority_data if p['gap_level'] != 'ADEQUATE']
-        top_priorities = recruitment_candidates[:10]  # Top 10 by score
+        critical_gaps = gaps_by_level[GapLevel.CRITICAL]
+        high_gaps = gaps_by_level[GapLevel.HIGH]
 
-        # Calculate total Scout impact (critical, high, and medium priority gaps only)
-        total_badge_requests_affected = sum(p['scout_demand'] for p in critical_gaps + high_gaps + medium_gaps)
+        # Eagle vs Non-Eagle breakdown
+        eagle_critical_count = sum(1 for p in critical_gaps if p['is_eagle_required'])
+        eagle_high_count = sum(1 for p in high_gaps if p['is_eagle_required'])
+
+        total_badge_requests_affected = (
+            demand_by_level[GapLevel.CRITICAL] + demand_by_level[GapLevel.HIGH] + demand_by_level[GapLevel.MEDIUM]
+        )
 
-        # Calculate unique Scouts affected by priority gaps
-        unique_scouts_affected = set()
-        for gap in critical_gaps + high_gaps + medium_gaps:
-            unique_scouts_affected.update(gap['interested_scouts'])
+        # Calculate unique Scouts affected by priority gaps (critical, high, and medium only)
+        unique_scouts_affected = set().union(*(
+            p['interested_scouts']
+            for gap_level in (GapLevel.CRITICAL, GapLevel.HIGH, GapLevel.MEDIUM)
+            for p in gaps_by_level[gap_level]
+        ))
         unique_scouts_count = len(unique_scouts_affected)
 
         analysis_summary = {
@@ -414,18 +530,18 @@ class CoverageGapAnalyzer:
             'gap_summary': {
                 'critical_gaps': len(critical_gaps),
                 'high_priority_gaps': len(high_gaps),
-                'medium_priority_gaps': len(medium_gaps),
-                'low_priority_gaps': len(low_gaps),
-                'adequate_coverage': len(adequate_gaps)
+                'medium_priority_gaps': len(gaps_by_level[GapLevel.MEDIUM]),
+                'low_priority_gaps': len(gaps_by_level[GapLevel.LOW]),
+                'adequate_coverage': len(gaps_by_level[GapLevel.ADEQUATE])
             },
             'eagle_badge_gaps': {
-                'critical_eagle_gaps': len(eagle_critical),
-                'high_priority_eagle_gaps': len(eagle_high)
+                'critical_eagle_gaps': eagle_critical_count,
+                'high_priority_eagle_gaps': eagle_high_count
             },
             'scout_impact': {
-                'badge_requests_affected_by_critical_gaps': sum(p['scout_demand'] for p in critical_gaps),
-                'badge_requests_affected_by_high_gaps': sum(p['scout_demand'] for p in high_gaps),
-                'badge_requests_affected_by_medium_gaps': sum(p['scout_demand'] for p in medium_gaps),
+                'badge_requests_affected_by_critical_gaps': demand_by_level[GapLevel.CRITICAL],
+                'badge_requests_affected_by_high_gaps': demand_by_level[GapLevel.HIGH],
+                'badge_requests_affected_by_medium_gaps': demand_by_level[GapLevel.MEDIUM],
                 'total_badge_requests_affected': total_badge_requests_affected,
                 'unique_scouts_affected': unique_scouts_count
             },
@@ -434,7 +550,7 @@ class CoverageGapAnalyzer:
                     'badge_name': p['badge_name'],
                     'priority_score': p['priority_score'],
                     'scout_demand': p['scout_demand'],
-                    'gap_level': p['gap_level'],
+                    'gap_level': p['gap_level'].name,
                     'is_eagle': p['is_eagle_required']
                 }
                 for p in top_priorities
@@ -457,24 +573,40 @@ class CoverageGapAnalyzer:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = self.processed_dir / f"coverage_priority_analysis_{timestamp}.json"
 
-        complete_analysis = {
-            'priority_analysis': priority_data,
-            'analysis_summary': analysis_summary
-        }
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(complete_analysis, f, indent=2, ensure_ascii=False)
+        # Write each top-level section straight to the file instead of wrapping both in one dict.
+        # Priority records are serialized one at a time, so no copy of the whole list is built
+        if orjson is not None:
+            dump_options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            with open(output_file, 'wb') as f:
+                f.write(b'{\n"priority_analysis": [')
+                for i, p in enumerate(priority_data):
+                    f.write(b',\n' if i else b'\n')
+                    f.write(orjson.dumps(p, option=dump_options))
+                f.write(b'\n],\n"analysis_summary": ')
+                f.write(orjson.dumps(analysis_summary, option=dump_options))
+                f.write(b'\n}\n')
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write('{\n"priority_analysis": [')
+                for i, p in enumerate(priority_data):
+                    f.write(',\n' if i else '\n')
+                    json.dump(p, f, indent=2, ensure_ascii=False)
+                f.write('\n],\n"analysis_summary": ')
+                json.dump(analysis_summary, f, indent=2, ensure_ascii=False)
+                f.write('\n}\n')
 
         print(f"✅ Saved priority analysis: {output_file}")
         return output_file
 
-    def analyze_coverage_gaps(self, demand_file: Optional[Path] = None, mbc_file: Optional[Path] = None) -> Dict:
+    def analyze_coverage_gaps(self, demand_file: Optional[Path] = None, mbc_file: Optional[Path] = None,
+                              save: bool = True) -> Dict:
         """
         Main analysis function - complete gap analysis pipeline
 
         Args:
             demand_file: Scout demand data file (optional, auto-detects if None)
             mbc_file: MBC coverage data file (optional, auto-detects if None)
+            save: Write coverage_priority_analysis_*.json (skip when only the returned data is used)
 
         Returns:
             Complete priority analysis data
@@ -496,11 +628,9 @@ class CoverageGapAnalyzer:
         print(f"📊 Loading demand data: {demand_file.name}")
         demand_data = self.load_demand_data(demand_file)
 
+        # Extract coverage information, streaming counselor records from the MBC data
         print(f"🎯 Loading MBC data: {mbc_file.name}")
-        mbc_data = self.load_mbc_data(mbc_file)
-
-        # Extract coverage information
-        coverage_data = self.extract_mbc_coverage(mbc_data)
+        coverage_data = self.extract_mbc_coverage(self.iter_mbc_counselors(mbc_file))
 
         # Calculate priority scores
         priority_data = self.calculate_priority_scores(demand_data, coverage_data)
@@ -508,8 +638,13 @@ class CoverageGapAnalyzer:
         # Generate analysis summary
         analysis_summary = self.generate_coverage_analysis(priority_data)
 
+        # Bucketing is done - switch records to level names for the saved and returned data
+        for p in priority_data:
+            p['gap_level'] = p['gap_level'].name
+
         # Save results
-        self.save_priority_analysis(priority_data, analysis_summary)
+        if save:
+            self.save_priority_analysis(priority_data, analysis_summary)
 
         # Print key findings
         summary = analysis_summary
@@ -550,6 +685,12 @@ Examples:
         type=str
     )
 
+    parser.add_argument(
+        '--no-save',
+        help='Print results without writing the priority analysis file',
+        action='store_true'
+    )
+
     parser.add_argument(
         '--processed-dir',
         help='Directory containing processed files',
@@ -572,7 +713,7 @@ def main():
         demand_path = Path(args.demand_file) if args.demand_file else None
         mbc_path = Path(args.mbc_file) if args.mbc_file else None
 
-        results = analyzer.analyze_coverage_gaps(demand_path, mbc_path)
+        results = analyzer.analyze_coverage_gaps(demand_path, mbc_path, save=not args.no_save)
 
         # Show top priorities
         top_priorities = results['analysis_summary']['top_recruitment_priorities'][:5]
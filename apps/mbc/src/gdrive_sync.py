@@ -13,22 +13,33 @@ Requirements:
     - Latest MBC reports generated in data/reports/
 """
 
+import hashlib
 import json
+import logging
 import os
+import random
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import re
-from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 
 try:
-    from googleapiclient.discovery import build
-    from googleapiclient.http import MediaFileUpload
-    from google.oauth2.service_account import Credentials
+    import orjson  # Optional fast JSON parser/serializer
 except ImportError:
-    print("❌ Google Drive API libraries not installed.")
-    print("   Run: pip install google-api-python-client google-auth")
-    sys.exit(1)
+    orjson = None
+
+log = logging.getLogger('gdrive_sync')
+
+
+def _parse_json(raw: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class GDriveSync:
@@ -40,6 +51,55 @@ class GDriveSync:
     # If modifying these scopes, delete the token file
     SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+    # Report directories are named {prefix}_MBC_Reports_YYYYMMDD_HHMMSS
+    REPORT_DIR_MARKER = '_MBC_Reports_'
+    TIMESTAMP_LENGTH = len('YYYYMMDD_HHMMSS')
+
+    # Report PDFs are named {prefix}_MBC_{report_type}_YYYYMMDD_HHMMSS.pdf
+    REPORT_TYPE_MARKER = '_MBC_'
+
+    # Expected PDF report types and their standardized names
+    FILE_MAPPINGS = {
+        'Troop_Counselors': 'T32_T7012_MBC_Troop_Counselors.pdf',
+        'Non_Counselors': 'T32_T7012_MBC_Non_Counselors.pdf',
+        'Coverage_Report': 'T32_T7012_MBC_Coverage_Report.pdf'
+    }
+
+    # Concurrent uploads cap - stays well under the Drive API write quota
+    MAX_CONCURRENT_UPLOADS = 4
+
+    # Files at or above this size (5 MiB) use a resumable upload session
+    RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+    # Google API client modules, imported on first authentication - they take
+    # hundreds of ms to load, which paths that never reach Drive should not pay
+    _gclient: ClassVar[Optional[SimpleNamespace]] = None
+
+    # Authenticated session shared by every GDriveSync in the process, so repeated
+    # syncs skip re-reading the key file and re-signing a token
+    _credentials_cache: ClassVar[Optional[Any]] = None
+    _service_cache: ClassVar[Optional[Any]] = None
+    _collections_cache: ClassVar[Optional[Tuple[Any, Any]]] = None
+    _cache_lock = threading.Lock()
+
+    # Per-thread authorized HTTP connections; httplib2.Http is not thread-safe
+    _thread_state = threading.local()
+
+    # Socket timeout (seconds) for Drive API connections
+    HTTP_TIMEOUT = 30
+
+    # Drive change-log position and folder listing saved between runs (next to credentials.json)
+    STATE_FILE = '.gdrive_sync_state.json'
+
+    # Local (path, size, mtime_ns) of each file as of its last successful upload
+    MANIFEST_FILE = '.gdrive_sync_manifest.json'
+
+    # Drive API statuses worth retrying: rate limits and transient server errors
+    RETRYABLE_STATUSES = frozenset({403, 429, 500, 502, 503, 504})
+
+    # Reuse a cached token only if it stays valid for at least this long
+    TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
     def __init__(self, reports_dir: str = "data/reports"):
         """
         Initialize Google Drive sync
@@ -51,7 +111,11 @@ class GDriveSync:
         - Configured GDriveSync instance
         """
         self.reports_dir = Path(reports_dir)
+        self.credentials = None
         self.service = None
+        # Drive files() and changes() collections; building one costs a few ms, so reuse them
+        self._files = None
+        self._changes = None
 
         if not self.reports_dir.exists():
             raise FileNotFoundError(f"Reports directory not found: {self.reports_dir}")
@@ -64,29 +128,147 @@ class GDriveSync:
         - None (looks for credentials.json file)
 
         Outputs:
-        - Sets self.service to authenticated Drive API service
+        - Sets self.credentials and self.service to authenticated Drive API service, and
+          caches its files() and changes() collections
 
         Raises:
         - Exception: If authentication fails
         """
+        with GDriveSync._cache_lock:
+            self._load_google_client()
+
+            cached = GDriveSync._credentials_cache
+            if GDriveSync._service_cache is not None and self._token_is_fresh(cached):
+                self.credentials = cached
+                self.service = GDriveSync._service_cache
+                self._files, self._changes = GDriveSync._collections_cache
+                log.info("✅ Reusing authenticated Google Drive API session")
+                return
+
+            self._authenticate_uncached()
+            GDriveSync._credentials_cache = self.credentials
+            GDriveSync._service_cache = self.service
+            GDriveSync._collections_cache = (self._files, self._changes)
+
+    @classmethod
+    def _load_google_client(cls) -> SimpleNamespace:
+        """
+        Import the Google API client libraries once and cache their handles
+
+        Inputs:
+        - None
+
+        Outputs:
+        - Namespace of the client classes and functions used by GDriveSync
+
+        Raises:
+        - Exception: If the libraries are not installed
+        """
+        if cls._gclient is None:
+            try:
+                import httplib2
+                import google_auth_httplib2
+                from googleapiclient.discovery import build
+                from googleapiclient.errors import HttpError
+                from googleapiclient.http import MediaIoBaseUpload
+                from google.oauth2.service_account import Credentials
+            except ImportError:
+                log.error("❌ Google Drive API libraries not installed.")
+                log.error("   Run: pip install google-api-python-client google-auth")
+                raise Exception("Google Drive API libraries not installed")
+
+            cls._gclient = SimpleNamespace(
+                Http=httplib2.Http,
+                AuthorizedHttp=google_auth_httplib2.AuthorizedHttp,
+                Request=google_auth_httplib2.Request,
+                build=build,
+                HttpError=HttpError,
+                MediaIoBaseUpload=MediaIoBaseUpload,
+                Credentials=Credentials,
+            )
+        return cls._gclient
+
+    def _token_is_fresh(self, creds) -> bool:
+        """
+        Check whether cached credentials can be reused without re-authenticating
+
+        Inputs:
+        - creds: Cached credentials, or None
+
+        Outputs:
+        - True if the token has not been minted yet or expires more than
+          TOKEN_EXPIRY_MARGIN from now
+        """
+        if creds is None:
+            return False
+        # google-auth stores expiry as a naive UTC datetime
+        return creds.expiry is None or creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None) > self.TOKEN_EXPIRY_MARGIN
+
+    def _authenticate_uncached(self) -> None:
+        """Load service account credentials from credentials.json and build the Drive service"""
         creds = None
 
         # Service account authentication
         service_account_file = 'credentials.json'
         if os.path.exists(service_account_file):
             try:
-                creds = Credentials.from_service_account_file(
-                    service_account_file, scopes=self.SCOPES)
-                print(f"✅ Using service account authentication: {service_account_file}")
+                with open(service_account_file, 'rb') as f:
+                    service_account_info = _parse_json(f.read())
+                creds = self._gclient.Credentials.from_service_account_info(
+                    service_account_info, scopes=self.SCOPES)
+                log.info("✅ Using service account authentication: %s", service_account_file)
             except Exception as e:
-                print(f"❌ Service account auth failed: {e}")
+                log.error("❌ Service account auth failed: %s", e)
                 raise Exception(f"Authentication failed: {e}")
         else:
             raise Exception("❌ credentials.json not found. Please download service account credentials from Google Cloud Console.")
 
-        self.service = build('drive', 'v3', credentials=creds)
-        print("✅ Google Drive API authenticated successfully")
+        # Mint the access token once up front so upload threads never race to refresh it
+        try:
+            creds.refresh(self._gclient.Request(self._gclient.Http(timeout=self.HTTP_TIMEOUT)))
+        except Exception as e:
+            log.error("❌ Service account auth failed: %s", e)
+            raise Exception(f"Authentication failed: {e}")
+
+        self.credentials = creds
+        self.service = self._build_service()
+        self._files = self.service.files()
+        self._changes = self.service.changes()
+        log.info("✅ Google Drive API authenticated successfully")
+
+    def _build_service(self):
+        """
+        Build a Drive API service from the authenticated credentials
+
+        Inputs:
+        - None (uses self.credentials)
+
+        Outputs:
+        - Drive API service shared by all threads; requests must be executed with
+          http=self._thread_http() since httplib2 is not thread-safe
+        """
+        # The client library bundles the Drive v3 discovery document, so building a
+        # service never fetches it over the network
+        return self._gclient.build('drive', 'v3', http=self._thread_http(),
+                     static_discovery=True, cache_discovery=False)
+
+    def _thread_http(self):
+        """
+        Get the calling thread's authorized HTTP connection, creating it on first use
 
+        Inputs:
+        - None (uses self.credentials)
+
+        Outputs:
+        - AuthorizedHttp whose keep-alive connections are reused for every Drive
+          call made from this thread
+        """
+        http = getattr(self._thread_state, 'http', None)
+        if http is None or http.credentials is not self.credentials:
+            http = self._gclient.AuthorizedHttp(
+                self.credentials, http=self._gclient.Http(timeout=self.HTTP_TIMEOUT))
+            self._thread_state.http = http
+        return http
 
     def find_latest_report_directory(self) -> Optional[Path]:
         """
@@ -99,28 +281,28 @@ class GDriveSync:
         - Path to latest report directory or None if not found
         """
         # Look for directories matching pattern: *_MBC_Reports_YYYYMMDD_HHMMSS
-        pattern = re.compile(r'.*_MBC_Reports_(\d{8}_\d{6})$')
+        # The fixed-width timestamp suffix sorts lexicographically in time order
+        ts_len = self.TIMESTAMP_LENGTH
 
         latest_dir = None
-        latest_timestamp = None
-
-        for item in self.reports_dir.iterdir():
-            if item.is_dir():
-                match = pattern.match(item.name)
-                if match:
-                    timestamp_str = match.group(1)
-                    try:
-                        timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                        if latest_timestamp is None or timestamp > latest_timestamp:
-                            latest_timestamp = timestamp
-                            latest_dir = item
-                    except ValueError:
-                        continue
+        latest_timestamp = ''
+
+        with os.scandir(self.reports_dir) as it:
+            for entry in it:
+                # Match the name first; only matching entries pay for a possible stat
+                name = entry.name
+                timestamp = name[-ts_len:]
+                if not (name[:-ts_len].endswith(self.REPORT_DIR_MARKER) and timestamp[8] == '_'
+                        and timestamp[:8].isdigit() and timestamp[9:].isdigit()):
+                    continue
+                if timestamp > latest_timestamp and entry.is_dir(follow_symlinks=False):
+                    latest_timestamp = timestamp
+                    latest_dir = Path(entry.path)
 
         if latest_dir:
-            print(f"📁 Found latest report directory: {latest_dir.name}")
+            log.info("📁 Found latest report directory: %s", latest_dir.name)
         else:
-            print("❌ No MBC report directories found")
+            log.error("❌ No MBC report directories found")
 
         return latest_dir
 
@@ -136,37 +318,41 @@ class GDriveSync:
         """
         pdf_files = []
 
-        # Expected PDF files and their standardized names
-        file_mappings = {
-            'Troop_Counselors': 'T32_T7012_MBC_Troop_Counselors.pdf',
-            'Non_Counselors': 'T32_T7012_MBC_Non_Counselors.pdf',
-            'Coverage_Report': 'T32_T7012_MBC_Coverage_Report.pdf'
-        }
+        with os.scandir(report_dir) as it:
+            pdf_paths = [Path(entry.path) for entry in it if entry.name.endswith('.pdf')]
 
-        for pdf_file in report_dir.glob('*.pdf'):
-            # Determine the standardized name based on file content type
-            standardized_name = None
+        for pdf_file in pdf_paths:
+            # Determine the standardized name based on file content type:
+            # {prefix}_MBC_{report_type}_{YYYYMMDD}_{HHMMSS}.pdf
+            report_type = pdf_file.name[:-4].rsplit('_', 2)[0].partition(self.REPORT_TYPE_MARKER)[2]
+            standardized_name = self.FILE_MAPPINGS.get(report_type)
 
-            for pattern, std_name in file_mappings.items():
-                if pattern in pdf_file.name:
-                    standardized_name = std_name
-                    break
+            if standardized_name is None:
+                # Fall back to a substring scan for files not named by the report generator
+                standardized_name = next(
+                    (std_name for pattern, std_name in self.FILE_MAPPINGS.items() if pattern in pdf_file.name),
+                    None)
 
             if standardized_name:
                 pdf_files.append((pdf_file, standardized_name))
-                print(f"📄 Found: {pdf_file.name} → {standardized_name}")
+                log.info("📄 Found: %s → %s", pdf_file.name, standardized_name)
             else:
-                print(f"⚠️ Unrecognized PDF file: {pdf_file.name}")
+                log.warning("⚠️ Unrecognized PDF file: %s", pdf_file.name)
 
         return pdf_files
 
-    def upload_file_to_gdrive(self, local_file: Path, gdrive_filename: str) -> bool:
+    def upload_file_to_gdrive(self, local_file: Path, gdrive_filename: str,
+                              existing_file: Optional[Dict[str, str]] = None,
+                              local_md5: Optional[str] = None) -> bool:
         """
-        Upload a file to Google Drive folder
+        Upload a file to Google Drive folder, skipping files whose content is unchanged
 
         Inputs:
         - local_file: Path to local file to upload
         - gdrive_filename: Filename to use in Google Drive
+        - existing_file: Drive metadata (id, md5Checksum, size) of the file to replace,
+          or None to create a new file
+        - local_md5: Precomputed MD5 hex digest of local_file, or None to hash it here
 
         Outputs:
         - True if upload successful, False otherwise
@@ -175,63 +361,329 @@ class GDriveSync:
         - Exception: If upload fails
         """
         try:
-            # Check if file already exists in the folder
-            existing_file_id = self._find_file_in_folder(gdrive_filename)
-
             # Prepare file metadata
             file_metadata = {
                 'name': gdrive_filename,
                 'parents': [self.GDRIVE_FOLDER_ID]
             }
 
-            # Upload the file
-            media = MediaFileUpload(str(local_file), resumable=True)
-
-            if existing_file_id:
-                # Update existing file
-                print(f"🔄 Updating existing file: {gdrive_filename}")
-                file = self.service.files().update(
-                    fileId=existing_file_id,
-                    media_body=media
-                ).execute()
-            else:
-                # Create new file
-                print(f"📤 Uploading new file: {gdrive_filename}")
-                file = self.service.files().create(
-                    body=file_metadata,
-                    media_body=media,
-                    fields='id'
-                ).execute()
-
-            print(f"✅ Successfully uploaded: {gdrive_filename} (ID: {file.get('id')})")
+            # Open the file once: hash it for the unchanged check if no digest was
+            # given, then rewind and stream the same handle to the upload
+            with open(local_file, 'rb') as fh:
+                local_size = os.fstat(fh.fileno()).st_size
+
+                if existing_file and existing_file.get('size') == str(local_size) \
+                        and existing_file.get('md5Checksum') == (local_md5 or self._stream_md5(fh)):
+                    log.info("⏭️ Unchanged, skipping upload: %s", gdrive_filename)
+                    return True
+                fh.seek(0)
+
+                # Small PDFs go up in a single multipart request, larger ones use a
+                # resumable session streamed in one chunk
+                media = self._gclient.MediaIoBaseUpload(
+                    fh, mimetype='application/pdf',
+                    resumable=local_size >= self.RESUMABLE_UPLOAD_THRESHOLD,
+                    chunksize=-1)
+
+                if existing_file:
+                    # Update existing file
+                    log.info("🔄 Updating existing file: %s", gdrive_filename)
+                    file = self._execute_with_retry(self._files.update(
+                        fileId=existing_file['id'],
+                        media_body=media,
+                        fields='id'
+                    ))
+                else:
+                    # Create new file
+                    log.info("📤 Uploading new file: %s", gdrive_filename)
+                    file = self._execute_with_retry(self._files.create(
+                        body=file_metadata,
+                        media_body=media,
+                        fields='id'
+                    ))
+
+            log.info("✅ Successfully uploaded: %s (ID: %s)", gdrive_filename, file.get('id'))
             return True
 
         except Exception as e:
-            print(f"❌ Failed to upload {gdrive_filename}: {str(e)}")
+            log.error("❌ Failed to upload %s: %s", gdrive_filename, e)
             return False
 
-    def _find_file_in_folder(self, filename: str) -> Optional[str]:
+    def _execute_with_retry(self, request, attempts: int = 4):
+        """
+        Execute a Drive API request, backing off on rate limits and transient errors
+
+        Inputs:
+        - request: Unexecuted Drive API request
+        - attempts: Maximum number of tries
+
+        Outputs:
+        - Response of the request
+
+        Raises:
+        - HttpError: If the request fails with a non-retryable status or on the last try
+        """
+        for attempt in range(attempts):
+            try:
+                return request.execute(http=self._thread_http())
+            except self._gclient.HttpError as e:
+                if e.resp.status not in self.RETRYABLE_STATUSES or attempt == attempts - 1:
+                    raise
+                delay = 2 ** attempt + random.uniform(0, 0.5)
+                log.warning("⏳ Drive API returned %s, retrying in %.1fs", e.resp.status, delay)
+                time.sleep(delay)
+
+    @staticmethod
+    def _stream_md5(fh) -> str:
+        """
+        Compute the MD5 hex digest Drive reports as md5Checksum
+
+        Inputs:
+        - fh: Binary file handle positioned at the start of the file
+
+        Outputs:
+        - Hex digest string
+        """
+        digest = hashlib.md5()
+        for block in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(block)
+        return digest.hexdigest()
+
+    @classmethod
+    def _local_md5(cls, local_file: Path) -> Optional[str]:
+        """
+        Compute the MD5 hex digest of a local file
+
+        Inputs:
+        - local_file: Path to local file
+
+        Outputs:
+        - Hex digest string, or None if the file cannot be read
+        """
+        try:
+            with open(local_file, 'rb') as fh:
+                return cls._stream_md5(fh)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _quote_query_value(value: str) -> str:
+        """
+        Quote a string literal for a Drive files.list query
+
+        Inputs:
+        - value: Raw string value
+
+        Outputs:
+        - Single-quoted literal with backslashes and single quotes escaped
+        """
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+    def _prefetch_existing_files(self, filenames: List[str]) -> Dict[str, Dict[str, str]]:
         """
-        Find a file by name in the Google Drive folder
+        Look up all target filenames in the Google Drive folder with one query
 
         Inputs:
-        - filename: Name of file to search for
+        - filenames: Names of files to search for
 
         Outputs:
-        - File ID if found, None otherwise
+        - Dict mapping filename -> {id, name, md5Checksum, size} for files that already exist
+
+        Raises:
+        - HttpError: If the query fails
         """
+        existing_files = {}
+        name_filter = " or ".join(f"name={self._quote_query_value(filename)}" for filename in filenames)
+        query = (f"{self._quote_query_value(self.GDRIVE_FOLDER_ID)} in parents "
+                 f"and trashed=false and ({name_filter})")
+
+        page_token = None
+        while True:
+            results = self._execute_with_retry(self._files.list(
+                q=query,
+                spaces='drive',
+                pageSize=len(filenames),
+                fields="files(id, name, md5Checksum, size), nextPageToken",
+                pageToken=page_token
+            ))
+            for file in results.get('files', []):
+                # Keep the first match, as the per-file lookup did
+                existing_files.setdefault(file['name'], file)
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        return existing_files
+
+    def _apply_drive_changes(self, state: Dict) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Bring the saved folder listing up to date from the Drive change log
+
+        Inputs:
+        - state: Saved sync state with 'token' (changes page token) and 'files'
+
+        Outputs:
+        - Dict mapping filename -> {id, name, md5Checksum, size} for files now in the
+          folder, or None if the change log could not be read (e.g. stale token)
+        """
+        files = dict(state.get('files', {}))
+        page_token = state['token']
         try:
-            query = f"name='{filename}' and parents in '{self.GDRIVE_FOLDER_ID}' and trashed=false"
-            results = self.service.files().list(q=query, fields="files(id, name)").execute()
-            files = results.get('files', [])
+            while True:
+                results = self._execute_with_retry(self._changes.list(
+                    pageToken=page_token,
+                    spaces='drive',
+                    restrictToMyDrive=True,
+                    fields="nextPageToken, newStartPageToken, "
+                           "changes(fileId, removed, file(id, name, md5Checksum, size, parents, trashed))"
+                ))
+                for change in results.get('changes', []):
+                    # Drop the old entry for this file; re-add it below if it is still in the folder
+                    for name in [name for name, file in files.items() if file['id'] == change.get('fileId')]:
+                        del files[name]
+
+                    file = change.get('file')
+                    if change.get('removed') or not file or file.get('trashed') \
+                            or self.GDRIVE_FOLDER_ID not in file.get('parents', []):
+                        continue
+                    files.setdefault(file['name'], {key: file.get(key) for key in ('id', 'name', 'md5Checksum', 'size')})
+
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    new_token = results['newStartPageToken']
+                    break
 
-            if files:
-                return files[0]['id']
+        except Exception as e:
+            log.warning("⚠️ Drive change log unavailable (%s), re-listing folder", e)
             return None
 
+        self._save_state({'token': new_token, 'files': files})
+        return files
+
+    def _lookup_existing_files(self, filenames: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Find which target filenames already exist in the Google Drive folder
+
+        Uses the Drive change log since the last sync when sync state is saved, so a
+        run only transfers what changed; falls back to a name query on the first run
+        or when the saved state is stale. That query always covers every FILE_MAPPINGS
+        name, since its result is saved as the folder state for later runs.
+
+        Inputs:
+        - filenames: Names of files to search for
+
+        Outputs:
+        - Dict mapping filename -> {id, name, md5Checksum, size} for files that already exist
+        """
+        state = self._load_state()
+        if state:
+            files = self._apply_drive_changes(state)
+            if files is not None:
+                return {name: files[name] for name in filenames if name in files}
+
+        # Take the change log position before listing so nothing is missed in between. The
+        # token is optional - without it the listing is still used, just not saved as state
+        token = None
+        try:
+            token = self._execute_with_retry(
+                self._changes.getStartPageToken(fields='startPageToken'))['startPageToken']
         except Exception as e:
-            print(f"⚠️ Error searching for file {filename}: {str(e)}")
+            log.warning("⚠️ Drive change log unavailable (%s), sync state not saved", e)
+
+        # List every report name, not just the pending ones - files skipped as unchanged this
+        # run must still be in the saved state, or a later update would create a duplicate
+        all_names = list(dict.fromkeys([*self.FILE_MAPPINGS.values(), *filenames]))
+        try:
+            folder_files = self._prefetch_existing_files(all_names)
+        except Exception as e:
+            log.warning("⚠️ Error searching for existing files: %s", e)
+            return {}
+
+        if token is not None:
+            self._save_state({'token': token, 'files': folder_files})
+        return {name: folder_files[name] for name in filenames if name in folder_files}
+
+    @staticmethod
+    def _read_json(path: str) -> Optional[Dict]:
+        """
+        Read a JSON object from a local bookkeeping file
+
+        Inputs:
+        - path: File to read
+
+        Outputs:
+        - Parsed dict, or None if the file is missing, unreadable, or not an object
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = _parse_json(f.read())
+        except (OSError, ValueError):
             return None
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def _write_json(path: str, data: Dict) -> None:
+        """
+        Atomically write a JSON object to a local bookkeeping file
+
+        Inputs:
+        - path: File to write
+        - data: Dict to save
+
+        Outputs:
+        - None (logs a warning if the file cannot be written)
+        """
+        tmp_file = f"{path}.tmp"
+        try:
+            if orjson is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+            os.replace(tmp_file, path)
+        except OSError as e:
+            log.warning("⚠️ Could not save %s: %s", path, e)
+
+    def _load_state(self) -> Optional[Dict]:
+        """
+        Load saved sync state
+
+        Inputs:
+        - None (reads STATE_FILE)
+
+        Outputs:
+        - State dict, or None if missing or unreadable
+        """
+        state = self._read_json(self.STATE_FILE)
+        return state if state and state.get('token') else None
+
+    def _save_state(self, state: Dict) -> None:
+        """
+        Atomically write sync state
+
+        Inputs:
+        - state: State dict to save to STATE_FILE
+
+        Outputs:
+        - None
+        """
+        self._write_json(self.STATE_FILE, state)
+
+    @staticmethod
+    def _manifest_entry(local_file: Path) -> List:
+        """
+        Build the manifest fingerprint of a local report file
+
+        Inputs:
+        - local_file: Path to local file
+
+        Outputs:
+        - [path, size, mtime_ns] list, matching its JSON round-trip
+        """
+        st = local_file.stat()
+        return [str(local_file), st.st_size, st.st_mtime_ns]
 
     def sync_reports(self) -> bool:
         """
@@ -243,14 +695,7 @@ class GDriveSync:
         Outputs:
         - True if all uploads successful, False otherwise
         """
-        print("🚀 Starting Google Drive sync...")
-
-        # Authenticate
-        try:
-            self.authenticate()
-        except Exception as e:
-            print(f"❌ Authentication failed: {e}")
-            return False
+        log.info("🚀 Starting Google Drive sync...")
 
         # Find latest report directory
         latest_dir = self.find_latest_report_directory()
@@ -260,30 +705,69 @@ class GDriveSync:
         # Get PDF files to upload
         pdf_files = self.get_pdf_files(latest_dir)
         if not pdf_files:
-            print("❌ No PDF files found to upload")
+            log.error("❌ No PDF files found to upload")
             return False
 
-        # Upload each file
-        success_count = 0
+        # Skip files unchanged since the last successful sync without any Drive calls
+        manifest = self._read_json(self.MANIFEST_FILE) or {}
+        pending = []
         for local_file, gdrive_name in pdf_files:
-            if self.upload_file_to_gdrive(local_file, gdrive_name):
-                success_count += 1
+            entry = self._manifest_entry(local_file)
+            if manifest.get(gdrive_name) == entry:
+                log.info("⏭️ Unchanged since last sync, skipping: %s", gdrive_name)
+            else:
+                pending.append((local_file, gdrive_name, entry))
 
-        # Report results
         total_files = len(pdf_files)
+        if not pending:
+            log.info("✅ All %d files already synced to Google Drive", total_files)
+            return True
+
+        # Authenticate
+        try:
+            self.authenticate()
+        except Exception as e:
+            log.error("❌ Authentication failed: %s", e)
+            return False
+
+        success_count = total_files - len(pending)
+        with ThreadPoolExecutor(max_workers=min(len(pending), self.MAX_CONCURRENT_UPLOADS)) as executor:
+            # Hash local files in the pool while checking which files already exist in the folder
+            md5_futures = {gdrive_name: executor.submit(self._local_md5, local_file)
+                           for local_file, gdrive_name, _ in pending}
+            existing_files = self._lookup_existing_files([gdrive_name for _, gdrive_name, _ in pending])
+
+            # Upload files concurrently - each upload is dominated by HTTP round-trips
+            futures = {
+                executor.submit(self.upload_file_to_gdrive, local_file, gdrive_name,
+                                existing_files.get(gdrive_name),
+                                md5_futures[gdrive_name].result()): (gdrive_name, entry)
+                for local_file, gdrive_name, entry in pending
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                    gdrive_name, entry = futures[future]
+                    manifest[gdrive_name] = entry
+
+        self._write_json(self.MANIFEST_FILE, manifest)
+
+        # Report results
         if success_count == total_files:
-            print(f"🎉 Successfully uploaded all {total_files} files to Google Drive!")
-            print(f"📁 Google Drive folder: https://drive.google.com/drive/folders/{self.GDRIVE_FOLDER_ID}")
+            log.info("🎉 Successfully uploaded all %d files to Google Drive!", total_files)
+            log.info("📁 Google Drive folder: https://drive.google.com/drive/folders/%s", self.GDRIVE_FOLDER_ID)
             return True
         else:
-            print(f"⚠️ Uploaded {success_count}/{total_files} files")
+            log.warning("⚠️ Uploaded %d/%d files", success_count, total_files)
             return False
 
 
 def main():
     """Main entry point for the script"""
-    print("📋 Merit Badge Counselor Report - Google Drive Sync")
-    print("=" * 50)
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
+    log.info("📋 Merit Badge Counselor Report - Google Drive Sync")
+    log.info("=" * 50)
 
     try:
         # Initialize and run sync
@@ -291,17 +775,17 @@ def main():
         success = sync.sync_reports()
 
         if success:
-            print("\n✅ Google Drive sync completed successfully!")
+            log.info("\n✅ Google Drive sync completed successfully!")
             sys.exit(0)
         else:
-            print("\n❌ Google Drive sync completed with errors")
+            log.error("\n❌ Google Drive sync completed with errors")
             sys.exit(1)
 
     except KeyboardInterrupt:
-        print("\n⚠️ Sync cancelled by user")
+        log.warning("\n⚠️ Sync cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Sync failed: {str(e)}")
+        log.error("\n❌ Sync failed: %s", e)
         sys.exit(1)
 
 
@@ -17,6 +17,10 @@ Requirements:
 
 import asyncio
 import json
+import logging
+import os
+import re
+import sys
 import time
 import random
 import argparse
@@ -24,20 +28,131 @@ import getpass
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
+try:
+    import lxml  # noqa: F401 - Optional C parser backend for BeautifulSoup
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    import orjson  # Optional fast JSON serializer
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional faster asyncio event loop (not available on Windows)
+except ImportError:
+    uvloop = None
+
+log = logging.getLogger('mbc_scraper')
+
+
+class SessionExpiredError(Exception):
+    """ScoutBook redirected a results request to its login page"""
+
+# Counselor record patterns, compiled once at import rather than per page/counselor
+# Email search starts only at the beginning of an address-character run and takes the local
+# part possessively ('@' is outside its class), so long runs without '@' are scanned once
+_EMAIL_RE = re.compile(r'(?<![a-zA-Z0-9._%+-])([a-zA-Z0-9._%+-]++@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+_PHONE_RE = re.compile(r'\((\d{3})\)\s(\d{3})-(\d{4})')
+_EXPIRY_RE = re.compile(r'Expires:\s*(\d{1,2}/\d{1,2}/\d{4})')
+_YPT_EXPIRY_RE = re.compile(r'Expires:\s*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE)
+_NAME_LOC_RE = re.compile(r'([A-Z][a-z]+ (?:\([A-Z][a-z]+\) )?[A-Z][a-z]+)\s*\n([A-Za-z,\s]+\d{5})')
+_ALT_NAME_RE = re.compile(r'(\w+)\s*\(([^)]+)\)\s*(.+)')
+# Location patterns only start at the beginning of a town-name run - a later start in the same run
+# reaches the same comma/ZIP, so this finds the same match without rescanning long runs per offset
+_LOCATION_RE = re.compile(r'(?<![A-Za-z\s])([A-Za-z\s]+,\s*[A-Z]{2}\s*\d{5})(?=Home|Mobile|Work|\(|$)')
+_LOCATION_PARTS_RE = re.compile(r'(?<![A-Za-z\s])([A-Za-z\s]+),\s*([A-Z]{2})\s*(\d{5})')
+_SECTION_LOCATION_RE = re.compile(r'(?<![A-Za-z\s,])([A-Za-z\s,]+\d{5})')
+_STATE_OR_ZIP_RE = re.compile(r'\b[A-Z]{2}\b|\d{5}')
+_LABELED_PHONE_RE = re.compile(r'(?P<kind>Home|Mobile|Work)[:\s]*\(?(\d{3})\)?[-.\s]*(\d{3})[-.\s]*(\d{4})', re.IGNORECASE)
+
+# Merit badge names recognised when a page lacks the mbContainer markup
+_FALLBACK_BADGES = ('Coin Collecting', 'Cooking', 'Golf', 'Painting', 'Skating', 'Citizenship', 'Communication',
+                    'Family Life', 'Genealogy', 'Personal Management', 'Camping', 'Cycling', 'Hiking', 'Personal Fitness')
+
+# Page-level regex fallback - emails, (XXX) XXX-XXXX phones, MM/DD/YYYY expiries and badge
+# names collected in a single scan, dispatched on the last named group that matched
+_CONTACT_RE = re.compile(
+    r'(?P<email>[a-zA-Z0-9._%+-]++@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|\((?P<area>\d{3})\)\s(?P<exchange>\d{3})-(?P<line>\d{4})'
+    r'|Expires:\s*(?P<expiry>\d{1,2}/\d{1,2}/\d{4})'
+    r'|(?P<badge>' + '|'.join(map(re.escape, _FALLBACK_BADGES)) + ')'
+)
+_BADGE_KEYWORDS = ('Coin Collecting', 'Cooking', 'Golf', 'Painting', 'Skating',
+                   'Citizenship in Society', 'Citizenship in the Community', 'Citizenship in the Nation', 'Citizenship in the World',
+                   'Communication', 'Family Life', 'Genealogy', 'Personal Management',
+                   'Camping', 'Cycling', 'Hiking', 'Personal Fitness')
+
+# Merit badge entries inside a counselor's div.mbContainer, and text marking non-badge entries
+_MB_SELECTOR = 'div.mb.ui-corner-all.ui-shadow'
+_MB_FALLBACK_SELECTOR = 'div[class*="mb" i]'
+_NON_BADGE_PHRASES = ('council', 'heart', 'england', 'approved', 'checkbox')
+
+
+def _find_badge_keywords(text: str, keywords=_BADGE_KEYWORDS) -> List[str]:
+    """Return the badge names from keywords that appear in text, in keyword order.
+
+    Uses one substring test per keyword - for a list this size CPython's C substring search is
+    faster than a single-pass regex alternation or Aho-Corasick automaton, whose per-hit Python
+    overhead dominates. Revisit if the list grows to the full badge catalog.
+    """
+    return [badge for badge in keywords if badge in text]
+
 
 class ScoutBookMBCScraper:
     """ScoutBook Merit Badge Counselor scraper using Playwright automation"""
     
-    def __init__(self, headless=False, wait_timeout=60000, max_retries=3):  # Default non-headless for easier auth
+    # Counselor search results are server-rendered, so they are fetched over plain HTTP
+    RESULTS_URL = "https://scoutbook.scouting.org/mobile/dashboard/admin/counselorresults.asp"
+    
+    # Result pages fetched at once after the page count is known
+    MAX_CONCURRENT_PAGES = 5
+    
+    # Login page selectors, joined into single selectors so each probe is one browser round trip
+    LOGIN_TRIGGER_SELECTOR = ', '.join(('a:has-text("Login")', 'a:has-text("Sign In")', 'button:has-text("Login")',
+                                        'button:has-text("Sign In")', '.login-trigger'))
+    LOGIN_PAGE_READY_SELECTOR = 'input[name="Email"], ' + LOGIN_TRIGGER_SELECTOR
+    OVERLAY_CLOSE_SELECTOR = ', '.join(('.close-btn', 'button:has-text("×")', 'button:has-text("Close")'))
+    
+    # Counselor entry selectors on a results page, tried in order
+    COUNSELOR_SELECTORS = (
+        'div[style*="margin-left: 65px"]',  # Legacy pattern
+        '.counselor-entry',
+        '.mb-counselor',
+        'div.counselor'
+    )
+    
+    # Manual login - wait this long (ms) for the post-login redirect, re-prompting a few times
+    MANUAL_LOGIN_TIMEOUT = 120_000
+    MANUAL_LOGIN_PROMPTS = 5
+    
+    # Saved cookies/local storage of the last logged-in session, reused to skip login
+    SESSION_STATE_FILE = "data/.sb_state.json"
+    
+    # Subresources the scraper never reads - aborted so page loads only pull HTML and scripts
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+    BLOCKED_URL_MARKERS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net')
+    
+    def __init__(self, headless=False, wait_timeout=60000, max_retries=3, debug=False):  # Default non-headless for easier auth
         self.headless = headless
+        self.debug = debug
         self.wait_timeout = wait_timeout
         self.max_retries = max_retries
         self.playwright = None
         self.browser = None
         self.page = None
         self.session_data = {}
+        self.state_path = Path(self.SESSION_STATE_FILE)
+        self.search_query = None
+        self.page_content = None
+        self.has_pagination = False
+        self.current_page = None
+        self.total_pages = None
+        self.failed_pages: List[int] = []
         
     async def setup_browser(self):
         """Initialize Playwright browser with human-like settings"""
@@ -52,25 +167,40 @@ class ScoutBookMBCScraper:
                     '--disable-dev-shm-usage', 
                     '--disable-blink-features=AutomationControlled',
                     '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor'
+                    '--disable-features=VizDisplayCompositor,Translate,BackForwardCache',
+                    '--blink-settings=imagesEnabled=false'
                 ]
             )
             
-            # Create new page with realistic user agent
-            self.page = await self.browser.new_page(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            # Create context with realistic user agent and common viewport, restoring the
+            # previous session's cookies when available
+            storage_state = str(self.state_path) if self.state_path.exists() else None
+            context = await self.browser.new_context(
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                viewport={"width": 1366, "height": 768},
+                storage_state=storage_state
             )
+            self.page = await context.new_page()
             
-            # Set viewport to common resolution
-            await self.page.set_viewport_size({"width": 1366, "height": 768})
+            # Skip images, media, fonts and analytics beacons
+            await self.page.route("**/*", self._route_request)
             
-            print("✅ Browser initialized successfully")
+            log.info("✅ Browser initialized successfully")
             return True
             
         except Exception as e:
-            print(f"❌ Browser setup failed: {e}")
+            log.error("❌ Browser setup failed: %s", e)
             return False
     
+    async def _route_request(self, route):
+        """Abort subresource requests the scraper has no use for"""
+        request = route.request
+        if (request.resource_type in self.BLOCKED_RESOURCE_TYPES or
+                any(marker in request.url for marker in self.BLOCKED_URL_MARKERS)):
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def human_delay(self, min_seconds=2, max_seconds=5):
         """Add human-like delay between actions"""
         delay = random.uniform(min_seconds, max_seconds)
@@ -79,61 +209,59 @@ class ScoutBookMBCScraper:
     async def login_to_scoutbook(self, username: str, password: str) -> bool:
         """Authenticate with ScoutBook using provided credentials"""
         try:
-            print("🔐 Navigating to ScoutBook login...")
+            log.info("🔐 Navigating to ScoutBook login...")
             
             # Navigate to ScoutBook login page
-            await self.page.goto('https://scoutbook.scouting.org', wait_until='networkidle')
+            await self.page.goto('https://scoutbook.scouting.org', wait_until='domcontentloaded')
             await self.human_delay()
             
             # Debug: Take screenshot and log page content for troubleshooting
-            print(f"📸 Current URL: {self.page.url}")
-            await self.page.screenshot(path='debug_login_page.png')
+            log.info("📸 Current URL: %s", self.page.url)
+            if self.debug:
+                await self.page.screenshot(path='debug_login_page.png')
             
             # Look for ScoutBook specific login form elements (wait for visible, not just present)
-            print("🔍 Checking for overlays or modals that might be hiding the form...")
+            log.info("🔍 Checking for overlays or modals that might be hiding the form...")
             
-            # Check if there's a modal or overlay hiding the form
-            await self.page.wait_for_timeout(3000)  # Give page time to fully load
+            # Check if there's a modal or overlay hiding the form - wait until the login
+            # form or a login link is attached rather than sleeping a fixed time
+            try:
+                await self.page.wait_for_selector(self.LOGIN_PAGE_READY_SELECTOR, state='attached', timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
             
-            # Try to dismiss any overlays/modals
-            overlay_selectors = ['.modal', '.overlay', '.popup', '[role="dialog"]', '.close-btn', 'button:has-text("×")', 'button:has-text("Close")']
-            for selector in overlay_selectors:
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        print(f"🎯 Found potential overlay: {selector}")
-                        if 'close' in selector.lower() or '×' in selector:
-                            await element.click()
-                            await self.human_delay(1, 2)
-                        break
-                except:
-                    continue
+            # Try to dismiss any overlays/modals - one combined query for their close controls
+            try:
+                element = await self.page.query_selector(self.OVERLAY_CLOSE_SELECTOR)
+                if element:
+                    log.info("🎯 Found potential overlay, closing it")
+                    await element.click()
+                    await self.human_delay(1, 2)
+            except:
+                pass
             
             # Try scrolling to make form visible
             await self.page.evaluate("window.scrollTo(0, 0)")
             await self.human_delay(1, 2)
             
             # Look for login button/link that might reveal the form
-            login_triggers = ['a:has-text("Login")', 'a:has-text("Sign In")', 'button:has-text("Login")', 'button:has-text("Sign In")', '.login-trigger']
-            for trigger in login_triggers:
-                try:
-                    element = await self.page.query_selector(trigger)
-                    if element:
-                        print(f"🎯 Found login trigger: {trigger}")
-                        await element.click()
-                        await self.human_delay(2, 3)
-                        break
-                except:
-                    continue
+            try:
+                element = await self.page.query_selector(self.LOGIN_TRIGGER_SELECTOR)
+                if element:
+                    log.info("🎯 Found login trigger")
+                    await element.click()
+                    await self.human_delay(2, 3)
+            except:
+                pass
             
             # Check if already logged in (login trigger might have redirected us)
             await self.human_delay(2, 3)
             current_url = self.page.url
             if 'dashboard' in current_url or 'mobile' in current_url:
-                print("✅ Already logged in after clicking login trigger")
+                log.info("✅ Already logged in after clicking login trigger")
                 return True
             
-            print("🔍 Waiting for login form to become visible...")
+            log.info("🔍 Waiting for login form to become visible...")
             try:
                 username_field = await self.page.wait_for_selector('input[name="Email"]', state='visible', timeout=10000)
                 password_field = await self.page.wait_for_selector('input[name="Password"]', state='visible', timeout=10000)
@@ -149,79 +277,120 @@ class ScoutBookMBCScraper:
                 login_button = await self.page.wait_for_selector('input[type="submit"], button[type="submit"], .login-btn', timeout=5000)
                 await login_button.click()
                 
-                # Wait for navigation after login (longer timeout for slow ScoutBook)
-                await self.page.wait_for_load_state('networkidle', timeout=45000)
+                # Wait for the post-login redirect (longer timeout for slow ScoutBook)
+                try:
+                    await self.page.wait_for_url(lambda url: 'dashboard' in url or 'mobile' in url, timeout=45000)
+                except PlaywrightTimeoutError:
+                    pass  # Reported by the URL check below
                 
             except PlaywrightTimeoutError:
                 # Form might not be visible, but check if we're already logged in
-                print("⚠️ Login form not found, checking if already authenticated...")
+                log.warning("⚠️ Login form not found, checking if already authenticated...")
             
             # Verify successful login
             current_url = self.page.url
             if 'dashboard' in current_url or 'mobile' in current_url:
-                print("✅ Login successful")
+                log.info("✅ Login successful")
                 return True
             else:
-                print(f"❌ Login may have failed - current URL: {current_url}")
+                log.error("❌ Login may have failed - current URL: %s", current_url)
                 return False
                 
         except Exception as e:
-            print(f"❌ Login failed: {e}")
+            log.error("❌ Login failed: %s", e)
             return False
     
+    async def wait_for_manual_login(self) -> bool:
+        """Wait for the user to finish logging in, returning as soon as ScoutBook redirects"""
+        timeout_seconds = self.MANUAL_LOGIN_TIMEOUT // 1000
+        for _ in range(self.MANUAL_LOGIN_PROMPTS):
+            log.info("⏱️ Waiting up to %s seconds for manual login...", timeout_seconds)
+            try:
+                await self.page.wait_for_url(lambda url: 'dashboard' in url or 'mobile' in url,
+                                             timeout=self.MANUAL_LOGIN_TIMEOUT)
+                log.info("✅ Manual login detected")
+                return True
+            except PlaywrightTimeoutError:
+                log.warning("⚠️ Still not logged in - please complete login in the browser window")
+        
+        log.error("❌ Manual login not completed, giving up")
+        return False
+    
     async def navigate_to_counselor_search(self, unit_id: str = "82190", zip_code: str = "01720", 
                                            council_id: str = "181", district_id: str = "430", proximity: int = 25) -> bool:
-        """Navigate directly to Merit Badge Counselor search results"""
+        """Fetch the first page of Merit Badge Counselor search results (raises SessionExpiredError)"""
         try:
             # Use direct search URL to bypass form configuration
-            search_url = (f"https://scoutbook.scouting.org/mobile/dashboard/admin/counselorresults.asp?"
-                         f"UnitID={unit_id}&MeritBadgeID=&formfname=&formlname=&zip={zip_code}&"
-                         f"formCouncilID={council_id}&formDistrictID={district_id}&Proximity={proximity}&"
-                         f"Availability=Available")
+            self.search_query = (f"UnitID={unit_id}&MeritBadgeID=&formfname=&formlname=&zip={zip_code}&"
+                                 f"formCouncilID={council_id}&formDistrictID={district_id}&Proximity={proximity}&"
+                                 f"Availability=Available")
             
-            print(f"🔍 Navigating directly to search results: {search_url}")
+            log.info("🔍 Fetching search results: %s?%s", self.RESULTS_URL, self.search_query)
             
-            await self.page.goto(search_url, wait_until='networkidle')
+            self.page_content = await self.fetch_results_page(1)
             await self.human_delay()
             
-            # Wait for results to load
-            await self.page.wait_for_selector('table, .counselor, .result, body', timeout=30000)
-            print("✅ Search results page loaded")
+            log.info("✅ Search results page loaded")
             return True
             
+        except SessionExpiredError:
+            raise  # Not a navigation failure - the caller decides whether to log in again
         except Exception as e:
-            print(f"❌ Failed to navigate to search results: {e}")
+            log.error("❌ Failed to navigate to search results: %s", e)
             return False
     
+    async def fetch_results_page(self, page_number: int) -> str:
+        """Fetch a results page over HTTP using the logged-in browser session's cookies"""
+        url = f"{self.RESULTS_URL}?{self.search_query}"
+        if page_number > 1:
+            url += f"&Page={page_number}"
+        
+        # The browser context's request client shares its cookie jar but skips page rendering
+        response = await self.page.context.request.get(url, timeout=self.wait_timeout)
+        if not response.ok:
+            raise Exception(f"HTTP {response.status} fetching results page {page_number}")
+        if 'counselorresults' not in response.url:
+            # Expired or missing session - ScoutBook redirects to its login page
+            raise SessionExpiredError(f"Redirected to {response.url} fetching results page {page_number}")
+        return await response.text()
+    
+    async def save_session_state(self):
+        """Persist the logged-in session so the next run can skip login"""
+        try:
+            await self.page.context.storage_state(path=str(self.state_path))
+            log.info("💾 Session state saved to %s", self.state_path)
+        except Exception as e:
+            log.warning("⚠️ Could not save session state: %s", e)
+    
     async def configure_search_parameters(self, zip_code: str = None, radius_miles: int = 25) -> bool:
         """Configure search form with 25-mile radius and ZIP code if provided"""
         try:
-            print("⚙️ Configuring search parameters...")
+            log.info("⚙️ Configuring search parameters...")
             
             # Set proximity radius to 25 miles
             radius_select = await self.page.wait_for_selector('select[name*="radius"], select[name*="proximity"], select[name*="miles"]', timeout=5000)
             if radius_select:
                 await radius_select.select_option(str(radius_miles))
-                print(f"✅ Set radius to {radius_miles} miles")
+                log.info("✅ Set radius to %s miles", radius_miles)
             
             # Set ZIP code if provided
             if zip_code:
                 zip_field = await self.page.query_selector('input[name*="zip"], input[name*="postal"]')
                 if zip_field:
                     await zip_field.fill(zip_code)
-                    print(f"✅ Set ZIP code to {zip_code}")
+                    log.info("✅ Set ZIP code to %s", zip_code)
             
             await self.human_delay()
             return True
             
         except Exception as e:
-            print(f"❌ Failed to configure search parameters: {e}")
+            log.error("❌ Failed to configure search parameters: %s", e)
             return False
     
     async def execute_search(self) -> bool:
         """Execute the search with configured parameters"""
         try:
-            print("🔍 Executing search...")
+            log.info("🔍 Executing search...")
             
             # Look for search/submit button
             search_button = await self.page.wait_for_selector(
@@ -230,314 +399,268 @@ class ScoutBookMBCScraper:
             )
             
             await search_button.click()
-            await self.page.wait_for_load_state('networkidle', timeout=45000)  # Increased for slow ScoutBook
+            # Wait for the results page itself rather than network quiet (increased for slow ScoutBook)
+            await self.page.wait_for_load_state('domcontentloaded', timeout=45000)
+            await self.page.wait_for_selector('input[name="pageCount"], div[style*="margin-left: 65px"]',
+                                              state='attached', timeout=30000)
             
-            print("✅ Search executed successfully")
+            log.info("✅ Search executed successfully")
             return True
             
         except Exception as e:
-            print(f"❌ Search execution failed: {e}")
+            log.error("❌ Search execution failed: %s", e)
             return False
     
-    async def extract_counselor_data(self, page_number: int = 1) -> List[Dict[str, Any]]:
-        """Extract Merit Badge Counselor data from current page"""
-        counselors = []
-        
+    async def extract_counselor_data(self, page_number: int = 1, page_content: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Extract Merit Badge Counselor data from the given (default: current) results page"""
         try:
-            print("📊 Extracting counselor data from page...")
-            
-            # Debug: Take screenshot and analyze page structure
-            await self.page.screenshot(path='debug_search_results.png')
-            print(f"📸 Screenshot saved: debug_search_results.png")
-            
-            # Wait longer for slow ScoutBook results
-            print("⏳ Waiting for search results to load (ScoutBook is slow)...")
-            await self.page.wait_for_timeout(10000)  # Give ScoutBook extra time
-            
-            # Debug: Check what elements are actually on the page
-            print("🔍 Analyzing page structure...")
-            page_text = await self.page.inner_text('body')
-            print(f"📝 Page contains {len(page_text)} characters")
-            
-            # Look for common result patterns
-            tables = await self.page.query_selector_all('table')
-            print(f"📋 Found {len(tables)} tables")
+            log.info("📊 Extracting counselor data from page...")
             
-            divs = await self.page.query_selector_all('div')
-            print(f"📦 Found {len(divs)} divs")
+            if page_content is None:
+                page_content = self.page_content
             
-            # Try broader selectors first
-            try:
-                await self.page.wait_for_selector('table, .counselor, .result, div, td, tr', timeout=5000)
-                print("✅ Found some content elements")
-            except:
-                print("❌ No standard content elements found")
-            
-            # Extract counselor data based on ScoutBook mobile results structure
-            # From screenshot: each counselor is in a block with name, location, contact, badges, expiration
-            
-            page_content = await self.page.content()
-            
-            # Save HTML file using run timestamp and page number
+            # Save HTML file using run timestamp and page number - written off the event loop
+            # so concurrent page fetches are not stalled by disk I/O
             html_file = f"{self.scraped_dir}/counselor_search_results_page_{page_number}.html"
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(page_content)
-            print(f"💾 HTML saved to {html_file}")
-            
-            # Look for counselor result blocks - they seem to be in a repeating pattern
-            # Try to find sections that contain counselor information
-            counselor_sections = await self.page.query_selector_all('div[style*="border"], .result-item, .counselor-item')
-            print(f"🔍 Found {len(counselor_sections)} potential counselor sections")
-            
-            if True:  # Force regex approach for now
-                # Try broader approach - look for divs that contain email addresses
-                print("🔍 Trying alternative approach - searching by content patterns...")
-                
-                # Get all text content and parse it for counselor data
-                import re
-                
-                # Parse using BeautifulSoup for better structure detection (from legacy code)
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(page_content, 'html.parser')
-                
-                # Look for counselor entries using legacy patterns
-                counselor_selectors = [
-                    'div[style*="margin-left: 65px"]',  # Legacy pattern
-                    '.counselor-entry',
-                    '.mb-counselor', 
-                    'div.counselor'
-                ]
-                
-                counselor_divs = []
-                for selector in counselor_selectors:
-                    counselor_divs = soup.select(selector)
-                    if counselor_divs:
-                        print(f"🎯 Found {len(counselor_divs)} counselor divs using selector: {selector}")
-                        break
-                
-                if not counselor_divs:
-                    # Fallback: look for any div containing email patterns
-                    all_divs = soup.find_all('div')
-                    counselor_divs = [div for div in all_divs if re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', div.get_text())]
-                    print(f"🔍 Fallback: Found {len(counselor_divs)} divs with email patterns")
-                
-                # Parse each counselor div using adapted legacy logic
-                structured_counselors = []
-                for i, div in enumerate(counselor_divs[:10]):  # Limit for testing
-                    counselor = self._parse_counselor_div_legacy(div, i+1)
-                    if counselor:
-                        structured_counselors.append(counselor)
-                
-                if structured_counselors:
-                    return structured_counselors
-                
-                # If structured parsing fails, fall back to regex patterns
-                name_location_pattern = r'([A-Z][a-z]+ (?:\([A-Z][a-z]+\) )?[A-Z][a-z]+)\s*\n([A-Za-z,\s]+\d{5})'
-                matches = re.findall(name_location_pattern, page_content)
-                print(f"👤 Regex fallback: Found {len(matches)} name-location pairs")
-                
-                # Email pattern for extracting contact info
-                email_pattern = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-                emails = re.findall(email_pattern, page_content)
-                print(f"📧 Found {len(emails)} email addresses")
-                
-                # Phone pattern (XXX) XXX-XXXX
-                phone_pattern = r'\((\d{3})\)\s(\d{3})-(\d{4})'
-                phones = re.findall(phone_pattern, page_content)
-                print(f"📞 Found {len(phones)} phone numbers")
-                
-                # Expiration date pattern (MM/DD/YYYY)
-                expiry_pattern = r'Expires:\s*(\d{1,2}/\d{1,2}/\d{4})'
-                expiries = re.findall(expiry_pattern, page_content)
-                print(f"📅 Found {len(expiries)} expiration dates")
-                
-                # Merit badge patterns - look for checked boxes or badge names
-                badge_pattern = r'(Coin Collecting|Cooking|Golf|Painting|Skating|Citizenship|Communication|Family Life|Genealogy|Personal Management|Camping|Cycling|Hiking|Personal Fitness)'
-                badges = re.findall(badge_pattern, page_content)
-                print(f"🏅 Found {len(badges)} merit badge mentions")
-                
-                # Try to correlate the data - for now, create entries based on what we found
-                max_counselors = max(len(matches), len(emails), len(expiries))
-                print(f"📊 Attempting to extract {max_counselors} counselor records")
-                
-                for i in range(min(max_counselors, 10)):  # Limit to 10 for testing
-                    counselor = {
-                        'name': matches[i][0] if i < len(matches) else 'Unknown',
-                        'location': matches[i][1] if i < len(matches) else 'Unknown',
-                        'email': emails[i] if i < len(emails) else '',
-                        'phone': f"({phones[i][0]}) {phones[i][1]}-{phones[i][2]}" if i < len(phones) else '',
-                        'ypt_expiration': expiries[i] if i < len(expiries) else '',
-                        'merit_badges': ', '.join(badges[i:i+3]) if badges else '',  # Take a few badges
-                        'extraction_timestamp': datetime.now().isoformat()
-                    }
-                    counselors.append(counselor)
+            await asyncio.to_thread(Path(html_file).write_text, page_content, encoding='utf-8')
+            log.info("💾 HTML saved to %s", html_file)
             
-            else:
-                # Process individual counselor sections
-                for i, section in enumerate(counselor_sections[:3]):  # Just first 3 for debugging
-                    try:
-                        section_text = await section.inner_text()
-                        print(f"🔍 Section {i+1} text (first 200 chars): {section_text[:200]}...")
-                        counselor = self._parse_counselor_section(section_text)
-                        if counselor:
-                            print(f"✅ Successfully parsed counselor: {counselor['name']}")
-                            counselors.append(counselor)
-                        else:
-                            print(f"❌ Failed to parse section {i+1}")
-                    except Exception as e:
-                        print(f"⚠️ Failed to process counselor section {i+1}: {e}")
-                        continue
-            
-            print(f"✅ Extracted {len(counselors)} counselors from current page")
+            counselors = self.parse_counselor_page(page_content)
+            
+            log.info("✅ Extracted %s counselors from current page", len(counselors))
             return counselors
             
         except Exception as e:
-            print(f"❌ Data extraction failed: {e}")
+            log.error("❌ Data extraction failed: %s", e)
             return []
     
-    async def check_for_pagination(self) -> bool:
-        """Check if there are more pages of results"""
+    def parse_counselor_page(self, page_content: str) -> List[Dict[str, Any]]:
+        """Parse counselor records and pagination state from results page HTML"""
+        # Parse using BeautifulSoup for better structure detection (from legacy code)
+        soup = BeautifulSoup(page_content, HTML_PARSER)
+        
+        # Record ScoutBook pagination state - page number input and total page count
+        page_input = soup.select_one('input[name="PageNumber2"], input[name="pageNumber2"]')
+        go_button = soup.select_one('input[name="gotoPageNumber2"], input[value*="Go to Page"]')
+        page_count_input = soup.select_one('input[name="pageCount"], #pageCount')
+        self.has_pagination = bool(page_input and go_button)
+        self.current_page = self._input_int_value(page_input)
+        self.total_pages = self._input_int_value(page_count_input)
+        
+        # Look for counselor entries using legacy patterns
+        counselor_divs = []
+        for selector in self.COUNSELOR_SELECTORS:
+            counselor_divs = soup.select(selector)
+            if counselor_divs:
+                log.info("🎯 Found %s counselor divs using selector: %s", len(counselor_divs), selector)
+                break
+        
+        if not counselor_divs:
+            # Fallback: look for any div containing email patterns - scan each text node once
+            # (cheap '@' test before the regex) and keep its enclosing divs in document order
+            email_div_ids = set()
+            for text in soup.find_all(string=lambda t: '@' in t):
+                if _EMAIL_RE.search(text):
+                    email_div_ids.update(id(parent) for parent in text.find_parents('div'))
+            counselor_divs = [div for div in soup.find_all('div') if id(div) in email_div_ids]
+            log.info("🔍 Fallback: Found %s divs with email patterns", len(counselor_divs))
+        
+        # All counselors on a page share one extraction timestamp
+        extraction_timestamp = datetime.now().isoformat()
+        
+        # Parse each counselor div using adapted legacy logic
+        structured_counselors = []
+        for i, div in enumerate(counselor_divs[:10]):  # Limit for testing
+            counselor = self._parse_counselor_div_legacy(div, i+1, extraction_timestamp)
+            if counselor:
+                structured_counselors.append(counselor)
+        
+        if structured_counselors:
+            return structured_counselors
+        
+        # If structured parsing fails, fall back to regex patterns
+        counselors = []
+        matches = _NAME_LOC_RE.findall(page_content)
+        log.info("👤 Regex fallback: Found %s name-location pairs", len(matches))
+        
+        # Emails, phones, expiration dates and merit badge names in one pass over the page
+        emails, phones, expiries, badges = [], [], [], []
+        for match in _CONTACT_RE.finditer(page_content):
+            kind = match.lastgroup
+            if kind == 'email':
+                emails.append(match.group('email'))
+            elif kind == 'line':
+                phones.append(match.group('area', 'exchange', 'line'))
+            elif kind == 'expiry':
+                expiries.append(match.group('expiry'))
+            else:
+                badges.append(match.group('badge'))
+        log.info("📧 Found %s email addresses", len(emails))
+        log.info("📞 Found %s phone numbers", len(phones))
+        log.info("📅 Found %s expiration dates", len(expiries))
+        log.info("🏅 Found %s merit badge mentions", len(badges))
+        
+        # Try to correlate the data - for now, create entries based on what we found
+        max_counselors = max(len(matches), len(emails), len(expiries))
+        log.info("📊 Attempting to extract %s counselor records", max_counselors)
+        
+        for i in range(min(max_counselors, 10)):  # Limit to 10 for testing
+            counselor = {
+                'name': matches[i][0] if i < len(matches) else 'Unknown',
+                'location': matches[i][1] if i < len(matches) else 'Unknown',
+                'email': emails[i] if i < len(emails) else '',
+                'phone': f"({phones[i][0]}) {phones[i][1]}-{phones[i][2]}" if i < len(phones) else '',
+                'ypt_expiration': expiries[i] if i < len(expiries) else '',
+                'merit_badges': ', '.join(badges[i:i+3]) if badges else '',  # Take a few badges
+                'extraction_timestamp': extraction_timestamp
+            }
+            counselors.append(counselor)
+        
+        return counselors
+    
+    @staticmethod
+    def _input_int_value(element) -> Optional[int]:
+        """Read an <input> element's value as an int, or None if missing or not numeric"""
         try:
-            # Look for ScoutBook pagination controls - page number input and Go to Page button
-            page_input = await self.page.query_selector('input[name="PageNumber2"], input[name="pageNumber2"]')
-            go_button = await self.page.query_selector('input[name="gotoPageNumber2"], input[value*="Go to Page"]')
-            
-            if page_input and go_button:
-                # Check current page vs total pages
-                current_page = await page_input.get_attribute('value')
-                page_count_input = await self.page.query_selector('input[name="pageCount"], #pageCount')
-                if page_count_input:
-                    total_pages = await page_count_input.get_attribute('value')
-                    print(f"📄 Pagination: Page {current_page} of {total_pages}")
-                    return int(current_page) < int(total_pages)
-                else:
-                    # Fallback: assume more pages if we have pagination controls
-                    print(f"📄 Found pagination controls, current page: {current_page}")
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            print(f"⚠️ Pagination check failed: {e}")
-            return False
+            return int(element.get('value'))
+        except (AttributeError, TypeError, ValueError):
+            return None
     
     async def navigate_to_next_page(self) -> bool:
-        """Navigate to next page of results using ScoutBook pagination"""
+        """Fetch the next page of results using ScoutBook pagination"""
         try:
-            print("➡️ Navigating to next page...")
+            log.info("➡️ Navigating to next page...")
             
             # Get current page number and increment it
-            page_input = await self.page.query_selector('input[name="PageNumber2"], input[name="pageNumber2"]')
-            if not page_input:
-                print("❌ Could not find page number input")
+            if self.current_page is None:
+                log.error("❌ Could not find page number input")
                 return False
                 
-            current_page = await page_input.get_attribute('value')
-            next_page = int(current_page) + 1
-            print(f"📄 Going from page {current_page} to page {next_page}")
+            next_page = self.current_page + 1
+            log.info("📄 Going from page %s to page %s", self.current_page, next_page)
             
-            # Set the new page number
-            await page_input.fill(str(next_page))
-            
-            # Try direct JavaScript navigation (ScoutBook uses $.mobile.changePage)
-            base_url = "https://scoutbook.scouting.org/mobile/dashboard/admin/counselorresults.asp"
-            params = f"?UnitID=82190&MeritBadgeID=&formfname=&formlname=&zip=01720&formCouncilID=181&formDistrictID=430&Proximity=25&Availability=Available&Page={next_page}"
-            new_url = base_url + params
-            
-            print(f"🔗 Navigating directly to: {new_url}")
-            await self.page.goto(new_url, wait_until='networkidle', timeout=45000)
+            self.page_content = await self.fetch_results_page(next_page)
             await self.human_delay()
             
-            print(f"✅ Successfully navigated to page {next_page}")
+            log.info("✅ Successfully navigated to page %s", next_page)
             return True
             
         except Exception as e:
-            print(f"❌ Next page navigation failed: {e}")
+            log.error("❌ Next page navigation failed: %s", e)
             return False
     
+    async def extract_remaining_pages(self, max_pages: int) -> List[Dict[str, Any]]:
+        """Fetch and extract pages 2..max_pages concurrently, in page order (failures go to failed_pages)"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+        
+        async def fetch_and_extract(page_number: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                log.info("📄 Processing page %s...", page_number)
+                page_content = await self.fetch_results_page(page_number)
+            return await self.extract_counselor_data(page_number, page_content)
+        
+        page_numbers = range(2, max_pages + 1)
+        results = await asyncio.gather(*(fetch_and_extract(n) for n in page_numbers), return_exceptions=True)
+        
+        counselors = []
+        for page_number, result in zip(page_numbers, results):
+            if isinstance(result, Exception):
+                log.error("❌ Failed to fetch page %s: %s", page_number, result)
+                self.failed_pages.append(page_number)
+                continue
+            counselors.extend(result)
+        
+        if self.failed_pages:
+            log.warning("⚠️ Partial results: %s of %s pages failed (pages %s)",
+                        len(self.failed_pages), max_pages, ', '.join(map(str, self.failed_pages)))
+        else:
+            log.info("✅ Reached final page (%s of %s)", max_pages, max_pages)
+        return counselors
+    
     async def scrape_all_counselors(self, username: str = None, password: str = None, unit_id: str = "82190", 
                                    zip_code: str = "01720", council_id: str = "181", district_id: str = "430") -> List[Dict[str, Any]]:
         """Complete scraping workflow for all Merit Badge Counselors"""
         all_counselors = []
         
         # Generate single timestamp for entire run
-        from datetime import datetime
-        import os
         self.run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.scraped_dir = f"data/scraped/{self.run_timestamp}"
         os.makedirs(self.scraped_dir, exist_ok=True)
-        print(f"📁 Created run directory: {self.scraped_dir}")
+        log.info("📁 Created run directory: %s", self.scraped_dir)
         
         try:
             # Setup browser
             if not await self.setup_browser():
                 return []
             
-            # Login if credentials provided, otherwise expect manual login
-            if username and password:
-                if not await self.login_to_scoutbook(username, password):
+            # Reuse the saved session if it is still valid, skipping login entirely
+            session_reused = False
+            if self.state_path.exists():
+                log.info("🔑 Trying saved session from %s", self.state_path)
+                try:
+                    session_reused = await self.navigate_to_counselor_search(unit_id, zip_code, council_id, district_id)
+                except SessionExpiredError:
+                    log.info("🔐 Saved session has expired, refreshing it with a new login")
+                else:
+                    if not session_reused:
+                        log.info("🔐 Could not use saved session, logging in again")
+            
+            if not session_reused:
+                # Login if credentials provided, otherwise expect manual login
+                if username and password:
+                    if not await self.login_to_scoutbook(username, password):
+                        return []
+                else:
+                    log.info("🔐 Please log in manually in the browser window...")
+                    await self.page.goto('https://scoutbook.scouting.org', wait_until='domcontentloaded', timeout=60000)
+                    if not await self.wait_for_manual_login():
+                        return []
+                
+                # Navigate directly to search results
+                if not await self.navigate_to_counselor_search(unit_id, zip_code, council_id, district_id):
                     return []
-            else:
-                print("🔐 Please log in manually in the browser window...")
-                await self.page.goto('https://scoutbook.scouting.org', wait_until='networkidle', timeout=60000)
-                print("⏱️ Waiting 60 seconds for manual login...")
-                await self.page.wait_for_timeout(60000)  # Wait 60 seconds for manual login
+                await self.save_session_state()
             
-            # Navigate directly to search results
-            if not await self.navigate_to_counselor_search(unit_id, zip_code, council_id, district_id):
-                return []
-            
-            # Extract data from all pages (detect total pages dynamically)
-            page_number = 1
-            max_pages = None  # Will be detected from page
+            # First page carries the total page count
+            log.info("📄 Processing page 1...")
+            all_counselors.extend(await self.extract_counselor_data(1))
             
-            while True:
-                print(f"📄 Processing page {page_number}...")
-                
-                page_counselors = await self.extract_counselor_data(page_number)
-                all_counselors.extend(page_counselors)
-                
-                # Detect total pages on first run
-                if max_pages is None:
-                    page_count_input = await self.page.query_selector('input[name="pageCount"], #pageCount')
-                    if page_count_input:
-                        total_pages_str = await page_count_input.get_attribute('value')
-                        max_pages = int(total_pages_str)
-                        print(f"📚 Detected {max_pages} total pages")
-                    else:
-                        max_pages = 999  # Fallback: rely on pagination detection
-                        print("⚠️ Could not detect total pages, will rely on pagination detection")
-
-                # Check for more pages
-                if await self.check_for_pagination():
-                    if page_number >= max_pages:
-                        print(f"✅ Reached final page ({page_number} of {max_pages})")
+            if self.total_pages is not None:
+                log.info("📚 Detected %s total pages", self.total_pages)
+                if self.total_pages > 1:
+                    # Page range is known - fetch the remaining pages concurrently
+                    all_counselors.extend(await self.extract_remaining_pages(self.total_pages))
+                else:
+                    log.info("✅ No more pages to process")
+            else:
+                # Fallback: follow the pagination controls one page at a time
+                log.warning("⚠️ Could not detect total pages, will rely on pagination detection")
+                for page_number in range(2, 1000):
+                    if not self.has_pagination or self.current_page is None:
+                        log.info("✅ No more pages to process")
                         break
-                    if await self.navigate_to_next_page():
-                        page_number += 1
-                        await self.human_delay(1, 2)  # Reduced delay for urgent report generation
-                        continue
-                    else:
-                        print("❌ Failed to navigate to next page, stopping")
+                    if not await self.navigate_to_next_page():
+                        log.error("❌ Failed to navigate to next page, stopping")
                         break
-                else:
-                    print("✅ No more pages to process")
-                    break
+                    log.info("📄 Processing page %s...", page_number)
+                    all_counselors.extend(await self.extract_counselor_data(page_number))
+                    await self.human_delay(1, 2)  # Reduced delay for urgent report generation
             
-            print(f"🎉 Scraping complete! Total counselors extracted: {len(all_counselors)}")
+            if self.failed_pages:
+                log.warning("⚠️ Scraping incomplete! Total counselors extracted: %s", len(all_counselors))
+            else:
+                log.info("🎉 Scraping complete! Total counselors extracted: %s", len(all_counselors))
             return all_counselors
             
         except Exception as e:
-            print(f"❌ Scraping workflow failed: {e}")
+            log.error("❌ Scraping workflow failed: %s", e)
             return []
         
         finally:
             await self.cleanup()
     
-    def _parse_counselor_div_legacy(self, div, counselor_num: int) -> Optional[Dict[str, Any]]:
+    def _parse_counselor_div_legacy(self, div, counselor_num: int, extraction_timestamp: str) -> Optional[Dict[str, Any]]:
         """Parse counselor data from HTML div using legacy enhanced scraper patterns"""
-        import re
-        
         try:
             counselor = {
                 'name': '',
@@ -552,28 +675,29 @@ class ScoutBookMBCScraper:
                 'phone_work': '',
                 'ypt_expiration': '',
                 'merit_badges': '',
-                'extraction_timestamp': datetime.now().isoformat()
+                'extraction_timestamp': extraction_timestamp
             }
             
-            # Get text content and lines
+            # Get text content and non-blank lines, stripping each line once
             full_text = div.get_text()
-            text_content = full_text
-            lines = [line.strip() for line in text_content.split('\n') if line.strip()]
+            lines = [line for line in map(str.strip, full_text.split('\n')) if line]
             
-            print(f"  📋 Counselor {counselor_num} has {len(lines)} text lines")
-            if len(lines) > 0:
-                print(f"  🔍 Sample lines: {lines[:5]}")  # Show first 5 lines
-            print(f"  📝 Full text preview: {full_text[:200]}...")  # Show first 200 chars
+            # Skip building the sample slice entirely unless debug output is on
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("  📋 Counselor %s has %s text lines", counselor_num, len(lines))
+                if len(lines) > 0:
+                    log.debug("  🔍 Sample lines: %s", lines[:5])  # Show first 5 lines
+                log.debug("  📝 Full text preview: %.200s...", full_text)  # Show first 200 chars
             
             if not lines:
                 return None
             
             # Extract name from first line (legacy logic)
             name_line = lines[0]
-            print(f"  👤 Name line: '{name_line}'")
+            log.debug("  👤 Name line: '%s'", name_line)
             
             # Parse name with alternate name support: "Timothy (Tim) Werner"
-            alt_match = re.search(r'(\w+)\s*\(([^)]+)\)\s*(.+)', name_line)
+            alt_match = _ALT_NAME_RE.search(name_line)
             if alt_match:
                 counselor["first_name"] = alt_match.group(1)
                 counselor["alt_first_name"] = alt_match.group(2) 
@@ -591,12 +715,12 @@ class ScoutBookMBCScraper:
             if address_div:
                 address_text = address_div.get_text().strip()
                 # Clean up address - extract Town/State/Zip portion
-                address_lines = [line.strip() for line in address_text.split('\n') if line.strip()]
+                address_lines = [line for line in map(str.strip, address_text.split('\n')) if line]
                 # Filter out phone/email lines, keep geographic location
                 location_lines = []
                 for line in address_lines:
                     if not any(keyword in line.lower() for keyword in ['home', 'mobile', 'work', '@', 'expires']):
-                        if re.search(r'\b[A-Z]{2}\b|\d{5}', line):  # Contains state or zip
+                        if _STATE_OR_ZIP_RE.search(line):  # Contains state or zip
                             location_lines.append(line)
                 counselor["location"] = ", ".join(location_lines)
             else:
@@ -604,68 +728,59 @@ class ScoutBookMBCScraper:
                 # Format: "Acton, MA 01720Home (978) 263-4038Mobile (508) 782-8502"
                 if len(lines) > 1:
                     location_line = lines[1]
-                    print(f"  🗺️ Location line: '{location_line}'")
+                    log.debug("  🗺️ Location line: '%s'", location_line)
                     # Extract location part before phone numbers
                     # Pattern: "Acton, MA 01720Home (978) 263-4038Mobile..."
-                    location_match = re.search(r'([A-Za-z\s]+,\s*[A-Z]{2}\s*\d{5})(?=Home|Mobile|Work|\(|$)', location_line)
+                    location_match = _LOCATION_RE.search(location_line)
                     if location_match:
                         counselor["location"] = location_match.group(1)
-                        print(f"  ✅ Extracted location: '{counselor['location']}'")
+                        log.debug("  ✅ Extracted location: '%s'", counselor['location'])
                     else:
-                        print(f"  ❌ Location regex failed on: '{location_line}'")
+                        log.debug("  ❌ Location regex failed on: '%s'", location_line)
                         # Try broader pattern in full text
-                        location_match = re.search(r'([A-Za-z\s]+),\s*([A-Z]{2})\s*(\d{5})', full_text)
+                        location_match = _LOCATION_PARTS_RE.search(full_text)
                         if location_match:
                             counselor["location"] = f"{location_match.group(1)}, {location_match.group(2)} {location_match.group(3)}"
-                            print(f"  ✅ Fallback location: '{counselor['location']}'")
+                            log.debug("  ✅ Fallback location: '%s'", counselor['location'])
             
             # Extract contact info from full text
             
             # Phone numbers (legacy patterns)
-            phone_patterns = [
-                (r'Home[:\s]*\(?(\d{3})\)?[-.\s]*(\d{3})[-.\s]*(\d{4})', "phone_home"),
-                (r'Mobile[:\s]*\(?(\d{3})\)?[-.\s]*(\d{3})[-.\s]*(\d{4})', "phone_mobile"), 
-                (r'Work[:\s]*\(?(\d{3})\)?[-.\s]*(\d{3})[-.\s]*(\d{4})', "phone_work")
-            ]
-            
-            for pattern, field in phone_patterns:
-                match = re.search(pattern, full_text, re.IGNORECASE)
-                if match:
-                    counselor[field] = f"({match.group(1)}) {match.group(2)}-{match.group(3)}"
+            # Home/Mobile/Work numbers in one scan - first number of each kind wins
+            for match in _LABELED_PHONE_RE.finditer(full_text):
+                field = f"phone_{match.group('kind').lower()}"
+                if not counselor[field]:
+                    counselor[field] = f"({match.group(2)}) {match.group(3)}-{match.group(4)}"
+                    if counselor["phone_home"] and counselor["phone_mobile"] and counselor["phone_work"]:
+                        break
             
             # Set primary phone to first available
             counselor["phone"] = counselor["phone_home"] or counselor["phone_mobile"] or counselor["phone_work"]
             
             # Email (legacy pattern)
-            email_match = re.search(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', full_text)
+            email_match = _EMAIL_RE.search(full_text)
             if email_match:
                 counselor["email"] = email_match.group(1)
             
             # Youth Protection expiration - look for div.yptDate in current div and parent containers
-            ypt_div = div.find('div', class_='yptDate')
-            if not ypt_div:
-                # Look in parent containers (yptDate might be a sibling)
-                parent = div.parent
-                while parent and parent.name == 'div' and not ypt_div:
-                    ypt_div = parent.find('div', class_='yptDate')
-                    parent = parent.parent
+            ypt_div = self._find_ypt_div(div)
             
             if ypt_div:
                 ypt_text = ypt_div.get_text().strip()
-                print(f"  📅 Found yptDate div: '{ypt_text}'")
+                log.debug("  📅 Found yptDate div: '%s'", ypt_text)
                 # Extract date from text like "Expires: 12/5/2026"
-                date_match = re.search(r'Expires:\s*(\d{1,2}/\d{1,2}/\d{4})', ypt_text, re.IGNORECASE)
+                date_match = _YPT_EXPIRY_RE.search(ypt_text)
                 if date_match:
                     counselor["ypt_expiration"] = date_match.group(1)
-                    print(f"  ✅ Extracted YPT expiration: {counselor['ypt_expiration']}")
+                    log.debug("  ✅ Extracted YPT expiration: %s", counselor['ypt_expiration'])
             else:
                 # Fallback: Look for "Expires:" pattern in the full text
-                yp_match = re.search(r'Expires:\s*(\d{1,2}/\d{1,2}/\d{4})', full_text, re.IGNORECASE)
+                yp_match = _YPT_EXPIRY_RE.search(full_text)
                 if yp_match:
                     counselor["ypt_expiration"] = yp_match.group(1)
-                    print(f"  ✅ Found YPT in full text: {counselor['ypt_expiration']}")
+                    log.debug("  ✅ Found YPT in full text: %s", counselor['ypt_expiration'])
                 else:
-                    print(f"  ❌ No YPT expiration found for {counselor['name']}")
+                    log.debug("  ❌ No YPT expiration found for %s", counselor['name'])
             
             # Merit badges from div.mbContainer as per requirements
             mb_container = div.find('div', class_='mbContainer')
@@ -673,45 +788,63 @@ class ScoutBookMBCScraper:
             
             if mb_container:
                 # Look for specific structure: div.mb.ui-corner-all.ui-shadow
-                badge_divs = mb_container.find_all('div', class_='mb ui-corner-all ui-shadow')
-                if not badge_divs:
-                    # Fallback: look for any div with 'mb' class
-                    badge_divs = mb_container.find_all('div', class_=lambda x: x and 'mb' in x.lower())
+                # Fallback: look for any div with 'mb' class
+                badge_divs = mb_container.select(_MB_SELECTOR) or mb_container.select(_MB_FALLBACK_SELECTOR)
                 
                 for badge_div in badge_divs:
                     badge_text = badge_div.get_text().strip()
                     # Filter out checkmark images and council info
-                    if badge_text and not any(phrase in badge_text.lower() for phrase in ['council', 'heart', 'england', 'approved', 'checkbox']):
-                        badge_list.append(badge_text)
+                    if badge_text:
+                        badge_text_lower = badge_text.lower()
+                        if not any(phrase in badge_text_lower for phrase in _NON_BADGE_PHRASES):
+                            badge_list.append(badge_text)
             else:
                 # Fallback: look for common merit badge names in text
-                badge_keywords = ['Coin Collecting', 'Cooking', 'Golf', 'Painting', 'Skating', 
-                                 'Citizenship in Society', 'Citizenship in the Community', 'Citizenship in the Nation', 'Citizenship in the World',
-                                 'Communication', 'Family Life', 'Genealogy', 'Personal Management', 
-                                 'Camping', 'Cycling', 'Hiking', 'Personal Fitness']
-                found_badges = [badge for badge in badge_keywords if badge in full_text]
+                found_badges = _find_badge_keywords(full_text)
                 badge_list = found_badges[:3]  # Limit to avoid duplicates
             
             counselor["merit_badges"] = ", ".join(badge_list)
             
-            print(f"  ✅ Parsed: {counselor['name']} | {counselor['location']} | {counselor['email']}")
+            log.debug("  ✅ Parsed: %s | %s | %s", counselor['name'], counselor['location'], counselor['email'])
             
             # Return if we have basic info
             if counselor["name"] and (counselor["email"] or counselor["phone"]):
                 return counselor
             else:
-                print(f"  ❌ Insufficient data for counselor {counselor_num}")
+                log.debug("  ❌ Insufficient data for counselor %s", counselor_num)
                 return None
                 
         except Exception as e:
-            print(f"  ⚠️ Error parsing counselor {counselor_num}: {e}")
+            log.warning("  ⚠️ Error parsing counselor %s: %s", counselor_num, e)
             return None
 
-    def _parse_counselor_section(self, section_text: str) -> Optional[Dict[str, Any]]:
-        """Parse individual counselor section text to extract structured data"""
-        import re
+    @staticmethod
+    def _find_ypt_div(div):
+        """Find the counselor's div.yptDate - inside the div, else in the nearest enclosing div that has one"""
+        ypt_div = div.find('div', class_='yptDate')
         
-        lines = section_text.strip().split('\n')
+        # Look in parent containers (yptDate might be a sibling) - only the parts of each
+        # parent not already searched, so subtrees are not rescanned on every level
+        searched = div
+        parent = div.parent
+        while parent and parent.name == 'div' and not ypt_div:
+            for child in parent.children:
+                if child.name is None:  # Text node
+                    continue
+                if child.name == 'div' and 'yptDate' in child.get('class', ()):
+                    ypt_div = child
+                elif child is not searched:
+                    ypt_div = child.find('div', class_='yptDate')
+                if ypt_div:
+                    break
+            searched = parent
+            parent = parent.parent
+        return ypt_div
+    
+    def _parse_counselor_section(self, section_text: str, extraction_timestamp: str) -> Optional[Dict[str, Any]]:
+        """Parse individual counselor section text to extract structured data"""
+        # Only the first line is used - split just far enough to check there are at least three
+        lines = section_text.strip().split('\n', 2)
         if len(lines) < 3:
             return None
         
@@ -722,41 +855,34 @@ class ScoutBookMBCScraper:
             'phone': '',
             'ypt_expiration': '',
             'merit_badges': '',
-            'extraction_timestamp': datetime.now().isoformat()
+            'extraction_timestamp': extraction_timestamp
         }
         
         # First line should be name
         counselor['name'] = lines[0].strip()
         
         # Look for location (town, state, zip)
-        location_pattern = r'([A-Za-z\s,]+\d{5})'
-        location_match = re.search(location_pattern, section_text)
+        location_match = _SECTION_LOCATION_RE.search(section_text)
         if location_match:
             counselor['location'] = location_match.group(1).strip()
         
         # Extract email
-        email_pattern = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        email_match = re.search(email_pattern, section_text)
+        email_match = _EMAIL_RE.search(section_text)
         if email_match:
             counselor['email'] = email_match.group(1)
         
         # Extract phone
-        phone_pattern = r'\((\d{3})\)\s(\d{3})-(\d{4})'
-        phone_match = re.search(phone_pattern, section_text)
+        phone_match = _PHONE_RE.search(section_text)
         if phone_match:
             counselor['phone'] = f"({phone_match.group(1)}) {phone_match.group(2)}-{phone_match.group(3)}"
         
         # Extract expiration date
-        expiry_pattern = r'Expires:\s*(\d{1,2}/\d{1,2}/\d{4})'
-        expiry_match = re.search(expiry_pattern, section_text)
+        expiry_match = _EXPIRY_RE.search(section_text)
         if expiry_match:
             counselor['ypt_expiration'] = expiry_match.group(1)
         
         # Extract merit badges (this will need refinement based on actual structure)
-        badge_keywords = ['Coin Collecting', 'Cooking', 'Golf', 'Painting', 'Skating', 'Citizenship', 
-                         'Communication', 'Family Life', 'Genealogy', 'Personal Management', 
-                         'Camping', 'Cycling', 'Hiking', 'Personal Fitness']
-        found_badges = [badge for badge in badge_keywords if badge in section_text]
+        found_badges = _find_badge_keywords(section_text, _FALLBACK_BADGES)
         counselor['merit_badges'] = ', '.join(found_badges)
         
         return counselor if counselor['name'] else None
@@ -768,27 +894,34 @@ class ScoutBookMBCScraper:
                 await self.browser.close()
             if self.playwright:
                 await self.playwright.stop()
-            print("🧹 Browser cleanup completed")
+            log.info("🧹 Browser cleanup completed")
         except Exception as e:
-            print(f"⚠️ Cleanup warning: {e}")
+            log.warning("⚠️ Cleanup warning: %s", e)
 
 
-def save_counselor_data(counselors: List[Dict[str, Any]], output_file: str):
-    """Save counselor data to JSON file"""
+def save_counselor_data(counselors: List[Dict[str, Any]], output_file: str, failed_pages: Optional[List[int]] = None):
+    """Save counselor data to JSON file, marking it incomplete if any result pages failed"""
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump({
-            'extraction_metadata': {
-                'timestamp': datetime.now().isoformat(),
-                'total_counselors': len(counselors),
-                'source': 'ScoutBook Merit Badge Counselor List'
-            },
-            'counselors': counselors
-        }, f, indent=2)
+    data = {
+        'extraction_metadata': {
+            'timestamp': datetime.now().isoformat(),
+            'total_counselors': len(counselors),
+            'complete': not failed_pages,
+            'failed_pages': failed_pages or [],
+            'source': 'ScoutBook Merit Badge Counselor List'
+        },
+        'counselors': counselors
+    }
     
-    print(f"💾 Data saved to {output_path}")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(data, f, indent=2)
+    
+    log.info("💾 Data saved to %s", output_path)
 
 
 async def main():
@@ -803,9 +936,13 @@ async def main():
     parser.add_argument('--council-id', default='181', help='Council ID (default: 181)')
     parser.add_argument('--district-id', default='430', help='District ID (default: 430)')
     parser.add_argument('--session-id', help='Session ID for scraped directory (provided by pipeline)')
+    parser.add_argument('--debug', action='store_true', help='Save debug screenshots and log per-counselor parsing details')
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+
     # Get credentials (optional now)
     username = args.username
     password = args.password
@@ -814,15 +951,14 @@ async def main():
         password = getpass.getpass("ScoutBook Password: ")
 
     # Initialize scraper
-    scraper = ScoutBookMBCScraper(headless=args.headless)
+    scraper = ScoutBookMBCScraper(headless=args.headless, debug=args.debug)
 
     # Override session timestamp if provided by pipeline
     if args.session_id:
-        import os
         scraper.run_timestamp = args.session_id
         scraper.scraped_dir = f"data/scraped/{args.session_id}"
         os.makedirs(scraper.scraped_dir, exist_ok=True)
-        print(f"📁 Using pipeline session ID: {args.session_id}")
+        log.info("📁 Using pipeline session ID: %s", args.session_id)
     
     # Run scraping
     counselors = await scraper.scrape_all_counselors(
@@ -836,11 +972,18 @@ async def main():
     
     # Save results
     if counselors:
-        save_counselor_data(counselors, args.output)
-        print(f"✅ Successfully scraped {len(counselors)} Merit Badge Counselors")
+        save_counselor_data(counselors, args.output, scraper.failed_pages)
+        if scraper.failed_pages:
+            log.warning("⚠️ Scraped %s Merit Badge Counselors, but pages %s failed - list is incomplete",
+                        len(counselors), ', '.join(map(str, scraper.failed_pages)))
+        else:
+            log.info("✅ Successfully scraped %s Merit Badge Counselors", len(counselors))
     else:
-        print("❌ No counselor data extracted")
+        log.error("❌ No counselor data extracted")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None and sys.platform != 'win32':
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
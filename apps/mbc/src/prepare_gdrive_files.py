@@ -12,15 +12,42 @@ Output:
     data/gdrive/ - Directory with standardized filenames
 """
 
+import errno
+import os
 import shutil
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Report directories are named *_MBC_Reports_YYYYMMDD_HHMMSS - searched for the anchored suffix
+# rather than matching a leading .* that backtracks over the whole name
+_DIR_RE = re.compile(r'_MBC_Reports_(\d{8}_\d{6})$')
+
+# os.link failures that mean "hard links are not possible here" - staging falls back to a copy.
+# Anything else (notably EEXIST) is a real error and is raised.
+_LINK_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('EXDEV', 'EPERM', 'ENOTSUP', 'EOPNOTSUPP', 'EMLINK') if hasattr(errno, name)
+)
+
 
 class GDriveFilePrep:
     """Prepare MBC reports for manual Google Drive upload"""
 
+    # Reports staged at once - independent I/O-bound copies
+    MAX_CONCURRENT_COPIES = 4
+
+    # Expected PDF files and their standardized names
+    FILE_MAPPINGS = {
+        'Troop_Counselors': 'T32_T7012_MBC_Troop_Counselors.pdf',
+        'Non_Counselors': 'T32_T7012_MBC_Non_Counselors.pdf',
+        'Coverage_Report': 'T32_T7012_MBC_Coverage_Report.pdf',
+        'Priority_Report': 'T32_T7012_MBC_Priority_Report.pdf'
+    }
+
+    # All report types in one pattern - a single scan per filename
+    REPORT_TYPE_PATTERN = re.compile('|'.join(map(re.escape, FILE_MAPPINGS)))
+
     def __init__(self, reports_dir: str = "data/reports"):
         """
         Initialize file preparation
@@ -50,26 +77,25 @@ class GDriveFilePrep:
         Raises:
         - FileNotFoundError: If no report directories found
         """
-        # Look for directories matching pattern: *_MBC_Reports_YYYYMMDD_HHMMSS
-        pattern = re.compile(r'.*_MBC_Reports_(\d{8}_\d{6})$')
-
-        latest_dir = None
-        latest_timestamp = None
-
         print("🔍 Scanning for report directories...")
-        for item in self.reports_dir.iterdir():
-            if item.is_dir():
-                match = pattern.match(item.name)
-                if match:
-                    timestamp_str = match.group(1)
-                    try:
-                        timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                        print(f"  Found: {item.name} ({timestamp})")
-                        if latest_timestamp is None or timestamp > latest_timestamp:
-                            latest_timestamp = timestamp
-                            latest_dir = item
-                    except ValueError:
-                        continue
+        candidates = []
+        with os.scandir(self.reports_dir) as entries:
+            for entry in entries:
+                match = _DIR_RE.search(entry.name)
+                if match and entry.is_dir():
+                    candidates.append((match.group(1), entry.name))
+        print(f"  Found {len(candidates)} report directories")
+
+        # YYYYMMDD_HHMMSS sorts chronologically as a string - newest first, and only
+        # the winner's timestamp needs validating
+        latest_dir = None
+        for timestamp_str, name in sorted(candidates, reverse=True):
+            try:
+                datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
+            except ValueError:
+                continue
+            latest_dir = self.reports_dir / name
+            break
 
         if not latest_dir:
             raise FileNotFoundError("❌ No MBC report directories found")
@@ -89,23 +115,11 @@ class GDriveFilePrep:
         """
         pdf_files = []
 
-        # Expected PDF files and their standardized names
-        file_mappings = {
-            'Troop_Counselors': 'T32_T7012_MBC_Troop_Counselors.pdf',
-            'Non_Counselors': 'T32_T7012_MBC_Non_Counselors.pdf',
-            'Coverage_Report': 'T32_T7012_MBC_Coverage_Report.pdf',
-            'Priority_Report': 'T32_T7012_MBC_Priority_Report.pdf'
-        }
-
         print("📄 Scanning for PDF files...")
         for pdf_file in report_dir.glob('*.pdf'):
             # Determine the standardized name based on file content type
-            standardized_name = None
-
-            for pattern, std_name in file_mappings.items():
-                if pattern in pdf_file.name:
-                    standardized_name = std_name
-                    break
+            match = self.REPORT_TYPE_PATTERN.search(pdf_file.name)
+            standardized_name = self.FILE_MAPPINGS[match.group(0)] if match else None
 
             if standardized_name:
                 pdf_files.append((pdf_file, standardized_name))
@@ -115,6 +129,55 @@ class GDriveFilePrep:
 
         return pdf_files
 
+    @staticmethod
+    def _stage_file(source_file: Path, dest_file: Path) -> int:
+        """
+        Place a report at its standardized name without copying data where possible
+
+        Inputs:
+        - source_file: Generated PDF report
+        - dest_file: Standardized path in the upload directory
+
+        Outputs:
+        - Size of the staged file in bytes
+        """
+        size = source_file.stat().st_size
+
+        # Reports are never modified after generation, so a hard link is as good as a copy
+        try:
+            os.link(source_file, dest_file)
+            return size
+        except OSError as e:
+            if e.errno not in _LINK_FALLBACK_ERRNOS:
+                raise  # e.g. EEXIST - two reports mapped to the same standardized name
+
+        # Create the copy exclusively - an existing dest_file may be a hard link to another
+        # report, and opening it for writing would overwrite that report through the link
+        with open(source_file, 'rb') as src, open(dest_file, 'xb') as dst:
+            # Kernel-side copy (reflink on Btrfs/XFS) where available, else a regular copy
+            copied_in_kernel = False
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    remaining = size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    copied_in_kernel = remaining == 0
+                except OSError:
+                    pass
+
+            if not copied_in_kernel:
+                # Restart from the beginning, discarding any partial kernel-side copy
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+                shutil.copyfileobj(src, dst)
+
+        shutil.copystat(source_file, dest_file)
+        return size
+
     def prepare_files(self) -> bool:
         """
         Main preparation function - copy files with standardized names
@@ -152,18 +215,19 @@ class GDriveFilePrep:
             print(f"\n📋 Copying {len(pdf_files)} files...")
             success_count = 0
 
-            for source_file, standardized_name in pdf_files:
-                try:
-                    dest_file = self.output_dir / standardized_name
-                    shutil.copy2(source_file, dest_file)
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_COPIES, len(pdf_files))) as executor:
+                futures = [executor.submit(self._stage_file, source_file, self.output_dir / standardized_name)
+                           for source_file, standardized_name in pdf_files]
 
-                    # Get file size for confirmation
-                    size_mb = dest_file.stat().st_size / (1024 * 1024)
-                    print(f"  ✅ {source_file.name} → {standardized_name} ({size_mb:.1f} MB)")
-                    success_count += 1
+                # Report in the original file order
+                for (source_file, standardized_name), future in zip(pdf_files, futures):
+                    try:
+                        size_mb = future.result() / (1024 * 1024)
+                        print(f"  ✅ {source_file.name} → {standardized_name} ({size_mb:.1f} MB)")
+                        success_count += 1
 
-                except Exception as e:
-                    print(f"  ❌ Failed to copy {source_file.name}: {e}")
+                    except Exception as e:
+                        print(f"  ❌ Failed to copy {source_file.name}: {e}")
 
             # Report results
             print(f"\n🎉 Preparation complete!")
@@ -13,19 +13,180 @@ Reports generated:
 
 import argparse
 import json
+import os
+from collections import defaultdict
 from datetime import datetime
+from html import escape
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import asyncio
 
+try:
+    import orjson  # Optional fast JSON parser
+except ImportError:
+    orjson = None
+
+
+def _parse_json(raw: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Eagle-required merit badges (including alternates) highlighted in the reports
+EAGLE_BADGES = frozenset({
+    'Camping', 'Citizenship in Society', 'Citizenship in the Community',
+    'Citizenship in the Nation', 'Citizenship in the World', 'Communication',
+    'Cooking', 'Emergency Preparedness', 'Environmental Science', 'Family Life',
+    'First Aid', 'Hiking', 'Lifesaving', 'Personal Fitness', 'Personal Management',
+    'Swimming', 'Cycling', 'Sustainability'
+})
+
+
+# Static portion of the common report header (styles and header container), built once
+# at import - only the title and generation time are formatted per report
+_HTML_HEADER_STATIC = """
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            background-color: #003f7f;
+            color: white;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 24px;
+        }
+        .timestamp {
+            font-size: 14px;
+            opacity: 0.9;
+        }
+        .controls {
+            background-color: white;
+            padding: 15px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .btn {
+            background-color: #007bff;
+            color: white;
+            border: none;
+            padding: 10px 20px;
+            border-radius: 4px;
+            cursor: pointer;
+            margin-right: 10px;
+            text-decoration: none;
+            display: inline-block;
+        }
+        .btn:hover {
+            background-color: #0056b3;
+        }
+        .content {
+            background-color: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 20px;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #ddd;
+        }
+        th {
+            background-color: #f8f9fa;
+            font-weight: bold;
+        }
+        tr:hover {
+            background-color: #f5f5f5;
+        }
+        .section {
+            margin-bottom: 30px;
+        }
+        .section h2 {
+            color: #003f7f;
+            border-bottom: 2px solid #003f7f;
+            padding-bottom: 10px;
+        }
+        .badge-list {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 5px;
+            margin-top: 5px;
+        }
+        .badge {
+            background-color: #e9ecef;
+            padding: 3px 8px;
+            border-radius: 12px;
+            font-size: 12px;
+        }
+        .eagle-badge {
+            background-color: #ffd700;
+            color: #000;
+        }
+        .coverage-table {
+            table-layout: fixed;
+        }
+        .coverage-table th:first-child {
+            width: 30%;
+        }
+        .coverage-table th:last-child {
+            width: 70%;
+        }
+        .coverage-table td {
+            vertical-align: top;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>"""
+
+
+def _escape_text(value: str) -> str:
+    """Escape a roster/analysis value for use as HTML element text"""
+    return escape(value, quote=False)
+
+
 class ReportGenerator:
+    # Possible locations of the official merit badge list, checked in order
+    MERIT_BADGE_FILE_PATHS = (
+        "data/input/all_merit_badges.txt",
+        "../data/input/all_merit_badges.txt",
+        "apps/mbc/data/input/all_merit_badges.txt"
+    )
+
     def __init__(self, data_file: str = "data/processed/roster_mbc_join.json", exclusion_file: str = "data/input/exclusion_list.txt", priority_file: str = None):
         self.data_file = Path(data_file)
         self.exclusion_file = Path(exclusion_file)
         self.priority_file = Path(priority_file) if priority_file else None
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._data = None  # Parsed data_file, loaded once on first use
+        self._all_badges = None  # Merit badge list, loaded once on first use
         self.fully_excluded, self.selective_inclusion = self.load_exclusion_list()
 
+        # Index fully excluded names by their names_match() keys so filtering is a set lookup per person
+        excluded_keys = [self._name_keys(name) for name in self.fully_excluded]
+        self._excluded_compact = {compact for compact, _ in excluded_keys}
+        self._excluded_first_last = {first_last for _, first_last in excluded_keys if first_last}
+        # Selective inclusion rules keep their file order, with each name's keys computed once
+        self._selective_rules = [(self._name_keys(name), badge) for name, badge in self.selective_inclusion.items()]
+
         # Determine troop abbreviations from data
         self.troop_abbrevs = self.get_troop_abbreviations()
         troop_prefix = "_".join(self.troop_abbrevs)
@@ -82,9 +243,13 @@ class ReportGenerator:
         Returns:
             Filtered badge string (may be empty if fully excluded, or single badge if selective)
         """
-        # Check if counselor has selective inclusion rule
-        for excluded_name, allowed_badge in self.selective_inclusion.items():
-            if self.names_match(name, excluded_name):
+        if not name or not self._selective_rules:
+            return badges
+
+        # Check if counselor has selective inclusion rule (same rules as names_match)
+        compact, first_last = self._name_keys(name)
+        for (rule_compact, rule_first_last), allowed_badge in self._selective_rules:
+            if compact == rule_compact or (first_last and first_last == rule_first_last):
                 # Only keep the allowed badge
                 badge_list = [b.strip() for b in badges.split(',')]
                 if allowed_badge in badge_list:
@@ -133,17 +298,40 @@ class ReportGenerator:
 
         return False
 
+    @staticmethod
+    def _name_keys(name: str) -> tuple[str, Optional[str]]:
+        """
+        Build the normalized keys names_match() compares
+
+        Returns:
+            Tuple of (lowercased name without spaces, lowercased "first last" or None if
+            the name has fewer than two parts)
+        """
+        name_lower = name.lower()
+        parts = name_lower.split()
+        first_last = f"{parts[0]} {parts[-1]}" if len(parts) >= 2 else None
+        return (name_lower.replace(' ', ''), first_last)
+
     def auto_detect_priority_file(self) -> Optional[Path]:
         """Auto-detect latest priority analysis file"""
-        processed_dir = Path("data/processed")
-        priority_files = list(processed_dir.glob("coverage_priority_analysis_*.json"))
+        # Single scandir pass - DirEntry caches its stat, unlike Path.glob + Path.stat
+        try:
+            with os.scandir("data/processed") as entries:
+                latest_entry = max(
+                    (entry for entry in entries
+                     if entry.name.startswith("coverage_priority_analysis_") and entry.name.endswith(".json")
+                     and entry.is_file()),
+                    key=lambda entry: entry.stat().st_mtime,
+                    default=None
+                )
+        except FileNotFoundError:
+            return None
 
-        if not priority_files:
+        if latest_entry is None:
             return None
 
         # Return most recent file
-        priority_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-        latest_file = priority_files[0]
+        latest_file = Path(latest_entry.path)
         print(f"🎯 Auto-detected priority analysis: {latest_file.name}")
         return latest_file
 
@@ -155,8 +343,7 @@ class ReportGenerator:
             print("ℹ️ No priority analysis data found - skipping priority report")
             return None
 
-        with open(priority_file, 'r', encoding='utf-8') as f:
-            priority_data = json.load(f)
+        priority_data = _parse_json(priority_file.read_bytes())
 
         print(f"📊 Loaded priority analysis from {priority_file.name}")
         return priority_data
@@ -164,17 +351,16 @@ class ReportGenerator:
     def get_troop_abbreviations(self) -> List[str]:
         """Get troop abbreviations from the data"""
         data = self.load_data()
-        troops = set()
         
         # Collect troops from both counselors and non-counselors
-        for counselor in data.get('troop_counselors', []):
-            troops.update(counselor.get('troops', []))
-        
-        for leader in data.get('non_counselor_leaders', []):
-            troops.update(leader.get('troops', []))
+        troops = {
+            troop
+            for person in chain(data.get('troop_counselors', ()), data.get('non_counselor_leaders', ()))
+            for troop in person.get('troops', ())
+        }
         
         # Sort and return as list
-        return sorted(list(troops))
+        return sorted(troops)
     
     def filter_excluded_names(self, people_list: List[Dict]) -> List[Dict]:
         """
@@ -191,16 +377,13 @@ class ReportGenerator:
 
         for person in people_list:
             full_name = person.get('name', '')
-            first_name = person.get('first_name', '')
-            last_name = person.get('last_name', '')
 
-            # Check if this person should be FULLY excluded
+            # Check if this person should be FULLY excluded (same rules as names_match)
             should_exclude = False
 
-            for excluded_name in self.fully_excluded:
-                if self.names_match(full_name, excluded_name):
-                    should_exclude = True
-                    break
+            if full_name:
+                compact, first_last = self._name_keys(full_name)
+                should_exclude = compact in self._excluded_compact or first_last in self._excluded_first_last
 
             if not should_exclude:
                 filtered.append(person)
@@ -215,28 +398,24 @@ class ReportGenerator:
     
     def get_all_merit_badges(self) -> List[str]:
         """Return comprehensive list of all current merit badges from official source"""
-        # Try multiple possible locations for the merit badge file
-        possible_paths = [
-            Path("data/input/all_merit_badges.txt"),
-            Path("../data/input/all_merit_badges.txt"),
-            Path("apps/mbc/data/input/all_merit_badges.txt")
-        ]
+        # Probe the file system and read the file only on first use
+        if self._all_badges is not None:
+            return self._all_badges
         
-        mb_file = None
-        for path in possible_paths:
-            if path.exists():
-                mb_file = path
-                break
+        # Try multiple possible locations for the merit badge file
+        mb_file = next((path for path in self.MERIT_BADGE_FILE_PATHS if os.path.isfile(path)), None)
         
         if not mb_file:
-            print(f"⚠️ Merit badge file not found in any of: {[str(p) for p in possible_paths]}")
+            print(f"⚠️ Merit badge file not found in any of: {list(self.MERIT_BADGE_FILE_PATHS)}")
             # Fallback to a basic list if file doesn't exist
-            return ['Camping', 'Hiking', 'First Aid']
+            self._all_badges = ['Camping', 'Hiking', 'First Aid']
+            return self._all_badges
         
         with open(mb_file, 'r') as f:
             badges = [line.strip() for line in f if line.strip()]
         
         print(f"📋 Loaded {len(badges)} merit badges from {mb_file}")
+        self._all_badges = badges
         return badges
     
     def get_positions_for_leader(self, leader: Dict) -> str:
@@ -257,9 +436,10 @@ class ReportGenerator:
         return '; '.join(positions) if positions else 'Unknown'
     
     def load_data(self) -> Dict:
-        """Load the joined roster and MBC data"""
-        with open(self.data_file, 'r') as f:
-            return json.load(f)
+        """Load the joined roster and MBC data (parsed once and reused for every report)"""
+        if self._data is None:
+            self._data = _parse_json(self.data_file.read_bytes())
+        return self._data
     
     def generate_html_header(self, title: str) -> str:
         """Generate common HTML header"""
@@ -269,130 +449,35 @@ class ReportGenerator:
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .header {{
-            background-color: #003f7f;
-            color: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 24px;
-        }}
-        .timestamp {{
-            font-size: 14px;
-            opacity: 0.9;
-        }}
-        .controls {{
-            background-color: white;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .btn {{
-            background-color: #007bff;
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            border-radius: 4px;
-            cursor: pointer;
-            margin-right: 10px;
-            text-decoration: none;
-            display: inline-block;
-        }}
-        .btn:hover {{
-            background-color: #0056b3;
-        }}
-        .content {{
-            background-color: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #f8f9fa;
-            font-weight: bold;
-        }}
-        tr:hover {{
-            background-color: #f5f5f5;
-        }}
-        .section {{
-            margin-bottom: 30px;
-        }}
-        .section h2 {{
-            color: #003f7f;
-            border-bottom: 2px solid #003f7f;
-            padding-bottom: 10px;
-        }}
-        .badge-list {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 5px;
-            margin-top: 5px;
-        }}
-        .badge {{
-            background-color: #e9ecef;
-            padding: 3px 8px;
-            border-radius: 12px;
-            font-size: 12px;
-        }}
-        .eagle-badge {{
-            background-color: #ffd700;
-            color: #000;
-        }}
-        .coverage-table {{
-            table-layout: fixed;
-        }}
-        .coverage-table th:first-child {{
-            width: 30%;
-        }}
-        .coverage-table th:last-child {{
-            width: 70%;
-        }}
-        .coverage-table td {{
-            vertical-align: top;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{title}</h1>
+    <title>{title}</title>{_HTML_HEADER_STATIC}{title}</h1>
         <div class="timestamp">Generated on {datetime.now().strftime("%B %d, %Y at %I:%M %p")}</div>
     </div>
 """
 
-    def generate_troop_counselors_report(self, data: Dict) -> str:
-        """Generate troop counselors HTML report"""
+    def iter_troop_counselors_report(self, data: Dict) -> Iterator[str]:
+        """Yield the troop counselors HTML report in fragments"""
         troop_prefix = "/".join(self.troop_abbrevs)
-        html = self.generate_html_header(f"{troop_prefix} Merit Badge Counselors")
+        
+        # Combine troop counselors and supplemental counselors
+        all_counselors = data.get('troop_counselors', []) + data.get('supplemental_counselors', [])
+
+        # Filter out excluded names
+        filtered_counselors = self.filter_excluded_names(all_counselors)
+
+        # Sort alphabetically by last name, first name
+        filtered_counselors.sort(key=lambda c: (c['last_name'], c['first_name']))
+
+        # Count is known before the heading is emitted
+        counselor_count = len(filtered_counselors)
+        
+        yield self.generate_html_header(f"{troop_prefix} Merit Badge Counselors")
         
         troop_filename_prefix = "_".join(self.troop_abbrevs)
-        html += f"""
+        yield f"""
     
     <div class="content">
         <div class="section">
-            <h2>{troop_prefix} Merit Badge Counselors</h2>
+            <h2>{troop_prefix} Merit Badge Counselors ({counselor_count})</h2>
             <p>Merit Badge Counselors associated with {" and ".join(self.troop_abbrevs)} including unit members and MBC-only registrations.</p>
             
             <table>
@@ -408,23 +493,6 @@ class ReportGenerator:
                 <tbody>
 """
         
-        # Combine troop counselors and supplemental counselors
-        all_counselors = data.get('troop_counselors', []) + data.get('supplemental_counselors', [])
-
-        # Filter out excluded names
-        filtered_counselors = self.filter_excluded_names(all_counselors)
-
-        # Sort alphabetically by last name, first name
-        filtered_counselors.sort(key=lambda c: (c['last_name'], c['first_name']))
-
-        counselor_count = len(filtered_counselors)
-        
-        # Update heading with count
-        html = html.replace(
-            f"<h2>{troop_prefix} Merit Badge Counselors</h2>",
-            f"<h2>{troop_prefix} Merit Badge Counselors ({counselor_count})</h2>"
-        )
-        
         for counselor in filtered_counselors:
             # Filter badges based on selective inclusion rules
             filtered_badges = self.filter_badges_for_counselor(
@@ -432,19 +500,16 @@ class ReportGenerator:
                 counselor['merit_badges']
             )
 
-            badges_html = f'<div class="badge-list">'
+            badges_parts = ['<div class="badge-list">']
             if filtered_badges:
                 for badge in filtered_badges.split(', '):
-                    if badge.strip():
+                    badge = badge.strip()
+                    if badge:
                         # Mark Eagle required badges
-                        eagle_badges = ['Camping', 'Citizenship in Society', 'Citizenship in the Community',
-                                       'Citizenship in the Nation', 'Citizenship in the World', 'Communication',
-                                       'Cooking', 'Emergency Preparedness', 'Environmental Science', 'Family Life',
-                                       'First Aid', 'Hiking', 'Lifesaving', 'Personal Fitness', 'Personal Management',
-                                       'Swimming', 'Cycling', 'Sustainability']
-                        badge_class = 'eagle-badge' if badge.strip() in eagle_badges else 'badge'
-                        badges_html += f'<span class="{badge_class}">{badge.strip()}</span>'
-            badges_html += '</div>'
+                        badge_class = 'eagle-badge' if badge in EAGLE_BADGES else 'badge'
+                        badges_parts.append(f'<span class="{badge_class}">{_escape_text(badge)}</span>')
+            badges_parts.append('</div>')
+            badges_html = ''.join(badges_parts)
             
             # Build phone number display with labels
             contact_info = [counselor['email']]
@@ -466,38 +531,41 @@ class ReportGenerator:
             elif counselor['phone']:  # Fallback to main phone field
                 contact_info.append(counselor['phone'])
             
-            contact_display = '<br>'.join(contact_info)
+            contact_display = '<br>'.join(map(_escape_text, contact_info))
 
-            html += f"""
+            yield f"""
                     <tr>
-                        <td>{counselor['name']}</td>
-                        <td>{counselor['troop_display']}</td>
+                        <td>{_escape_text(counselor['name'])}</td>
+                        <td>{_escape_text(counselor['troop_display'])}</td>
                         <td>{contact_display}</td>
-                        <td>{counselor['ypt_expiration']}</td>
+                        <td>{_escape_text(counselor['ypt_expiration'])}</td>
                         <td>{badges_html}</td>
                     </tr>"""
         
-        html += """
+        yield """
                 </tbody>
             </table>
         </div>
     </div>
 </body>
 </html>"""
-        
-        return html
     
-    def generate_non_counselors_report(self, data: Dict) -> str:
-        """Generate non-counselor leaders HTML report"""
+    def iter_non_counselors_report(self, data: Dict) -> Iterator[str]:
+        """Yield the non-counselor leaders HTML report in fragments"""
         troop_prefix = "/".join(self.troop_abbrevs)
-        html = self.generate_html_header(f"{troop_prefix} Non-Counselor Leaders")
+        
+        # Filter out excluded names; count is known before the heading is emitted
+        filtered_leaders = self.filter_excluded_names(data['non_counselor_leaders'])
+        leader_count = len(filtered_leaders)
+        
+        yield self.generate_html_header(f"{troop_prefix} Non-Counselor Leaders")
         
         troop_filename_prefix = "_".join(self.troop_abbrevs)
-        html += f"""
+        yield f"""
     
     <div class="content">
         <div class="section">
-            <h2>{troop_prefix} Leaders Who Are NOT Merit Badge Counselors</h2>
+            <h2>{troop_prefix} Leaders Who Are NOT Merit Badge Counselors ({leader_count})</h2>
             <p>Adult members of {" and ".join(self.troop_abbrevs)} who could potentially become Merit Badge Counselors.</p>
             
             <table>
@@ -511,47 +579,30 @@ class ReportGenerator:
                 <tbody>
 """
         
-        # Filter out excluded names
-        filtered_leaders = self.filter_excluded_names(data['non_counselor_leaders'])
-        leader_count = len(filtered_leaders)
-        
-        # Update heading with count
-        html = html.replace(
-            f"<h2>{troop_prefix} Leaders Who Are NOT Merit Badge Counselors</h2>",
-            f"<h2>{troop_prefix} Leaders Who Are NOT Merit Badge Counselors ({leader_count})</h2>"
-        )
-        
         for leader in filtered_leaders:
             position = self.get_positions_for_leader(leader)
-            html += f"""
+            yield f"""
                     <tr>
-                        <td>{leader['name']}</td>
-                        <td>{leader['troop_display']}</td>
-                        <td>{position}</td>
+                        <td>{_escape_text(leader['name'])}</td>
+                        <td>{_escape_text(leader['troop_display'])}</td>
+                        <td>{_escape_text(position)}</td>
                     </tr>"""
         
-        html += """
+        yield """
                 </tbody>
             </table>
         </div>
     </div>
 </body>
 </html>"""
-        
-        return html
     
-    def generate_coverage_report(self, data: Dict) -> str:
-        """Generate merit badge coverage report matching legacy format"""
+    def iter_coverage_report(self, data: Dict) -> Iterator[str]:
+        """Yield the merit badge coverage report (legacy format) in fragments"""
         troop_prefix = "/".join(self.troop_abbrevs)
-        html = self.generate_html_header(f"{troop_prefix} Merit Badge Coverage Report")
+        yield self.generate_html_header(f"{troop_prefix} Merit Badge Coverage Report")
         
-        # Get all merit badges and Eagle-required badges
+        # Get all merit badges
         all_merit_badges = self.get_all_merit_badges()
-        eagle_badges = ['Camping', 'Citizenship in Society', 'Citizenship in the Community', 
-                       'Citizenship in the Nation', 'Citizenship in the World', 'Communication',
-                       'Cooking', 'Emergency Preparedness', 'Environmental Science', 'Family Life',
-                       'First Aid', 'Hiking', 'Lifesaving', 'Personal Fitness', 'Personal Management',
-                       'Swimming', 'Cycling', 'Sustainability']
         
         # Combine troop counselors and supplemental counselors for coverage analysis
         all_counselors = data.get('troop_counselors', []) + data.get('supplemental_counselors', [])
@@ -563,9 +614,9 @@ class ReportGenerator:
         filtered_counselors.sort(key=lambda c: (c['last_name'], c['first_name']))
         
         # Create mapping of badges to counselors
-        badge_to_counselors = {}
+        badge_to_counselors = defaultdict(list)
         for counselor in filtered_counselors:
-            counselor_display = f"{counselor['name']} ({counselor['troop_display']})"
+            counselor_display = _escape_text(f"{counselor['name']} ({counselor['troop_display']})")
 
             # Filter badges based on selective inclusion rules
             filtered_badges = self.filter_badges_for_counselor(
@@ -577,34 +628,20 @@ class ReportGenerator:
                 for badge in filtered_badges.split(', '):
                     badge = badge.strip()
                     if badge:
-                        if badge not in badge_to_counselors:
-                            badge_to_counselors[badge] = []
                         badge_to_counselors[badge].append(counselor_display)
         
-        # Categorize badges
-        eagle_with_counselors = []
-        eagle_without_counselors = []
-        non_eagle_with_counselors = []
-        non_eagle_without_counselors = []
-        
-        for badge in all_merit_badges:
-            is_eagle = badge in eagle_badges
-            has_counselor = badge in badge_to_counselors
-            
-            if is_eagle:
-                if has_counselor:
-                    eagle_with_counselors.append(badge)
-                else:
-                    eagle_without_counselors.append(badge)
-            else:
-                if has_counselor:
-                    non_eagle_with_counselors.append(badge)
-                else:
-                    non_eagle_without_counselors.append(badge)
+        # Categorize badges with set operations, each category sorted once for display
+        all_badges = set(all_merit_badges)
+        covered_badges = badge_to_counselors.keys() & all_badges
+        uncovered_badges = all_badges - covered_badges
+        eagle_with_counselors = sorted(covered_badges & EAGLE_BADGES)
+        eagle_without_counselors = sorted(uncovered_badges & EAGLE_BADGES)
+        non_eagle_with_counselors = sorted(covered_badges - EAGLE_BADGES)
+        non_eagle_without_counselors = sorted(uncovered_badges - EAGLE_BADGES)
         
         troop_filename_prefix = "_".join(self.troop_abbrevs)
         
-        html += f"""
+        yield f"""
     
     <div class="content">
         <h2>{troop_prefix} Merit Badge Coverage Report</h2>
@@ -615,16 +652,16 @@ class ReportGenerator:
                 <tr><th>Merit Badge</th><th>Counselors</th></tr>
 """
         
-        for badge in sorted(eagle_with_counselors):
+        for badge in eagle_with_counselors:
             counselor_list = '<br>'.join(badge_to_counselors[badge])
-            html += f"""
+            yield f"""
                 <tr>
-                    <td>{badge}</td>
+                    <td>{_escape_text(badge)}</td>
                     <td>{counselor_list}</td>
                 </tr>
 """
         
-        html += f"""
+        yield f"""
             </table>
         </div>
         
@@ -633,10 +670,10 @@ class ReportGenerator:
             <div class="badge-list">
 """
         
-        for badge in sorted(eagle_without_counselors):
-            html += f'<span class="badge eagle-badge">{badge}</span>'
+        for badge in eagle_without_counselors:
+            yield f'<span class="badge eagle-badge">{_escape_text(badge)}</span>'
         
-        html += f"""
+        yield f"""
             </div>
         </div>
         
@@ -646,16 +683,16 @@ class ReportGenerator:
                 <tr><th>Merit Badge</th><th>Counselors</th></tr>
 """
         
-        for badge in sorted(non_eagle_with_counselors):
+        for badge in non_eagle_with_counselors:
             counselor_list = '<br>'.join(badge_to_counselors[badge])
-            html += f"""
+            yield f"""
                 <tr>
-                    <td>{badge}</td>
+                    <td>{_escape_text(badge)}</td>
                     <td>{counselor_list}</td>
                 </tr>
 """
         
-        html += f"""
+        yield f"""
             </table>
         </div>
         
@@ -664,22 +701,20 @@ class ReportGenerator:
             <div class="badge-list">
 """
         
-        for badge in sorted(non_eagle_without_counselors):
-            html += f'<span class="badge">{badge}</span>'
+        for badge in non_eagle_without_counselors:
+            yield f'<span class="badge">{_escape_text(badge)}</span>'
         
-        html += """
+        yield """
             </div>
         </div>
     </div>
 </body>
 </html>"""
-        
-        return html
 
-    def generate_priority_report(self, priority_data: Dict) -> str:
-        """Generate priority coverage analysis report with Scout demand data"""
+    def iter_priority_report(self, priority_data: Dict) -> Iterator[str]:
+        """Yield the priority coverage analysis report with Scout demand data in fragments"""
         troop_prefix = "/".join(self.troop_abbrevs)
-        html = self.generate_html_header(f"{troop_prefix} Merit Badge Coverage Priority Analysis")
+        yield self.generate_html_header(f"{troop_prefix} Merit Badge Coverage Priority Analysis")
 
         analysis = priority_data.get('analysis_summary', {})
         priorities = priority_data.get('priority_analysis', [])
@@ -689,7 +724,7 @@ class ReportGenerator:
         high_gaps = [p for p in priorities if p['gap_level'] == 'HIGH']
         medium_gaps = [p for p in priorities if p['gap_level'] == 'MEDIUM']
 
-        html += f"""
+        yield f"""
 
     <div class="content">
         <h2>{troop_prefix} Merit Badge Coverage Priority Analysis</h2>
@@ -764,7 +799,7 @@ class ReportGenerator:
         sorted_critical_gaps = sorted(critical_gaps, key=lambda x: x['badge_name'])
         for gap in sorted_critical_gaps:
             eagle_indicator = "🦅 " if gap['is_eagle_required'] else ""
-            scouts_list = ", ".join(gap['interested_scouts'][:3])  # Show first 3 scouts
+            scouts_list = ", ".join(map(_escape_text, gap['interested_scouts'][:3]))  # Show first 3 scouts
             if len(gap['interested_scouts']) > 3:
                 scouts_list += f" +{len(gap['interested_scouts']) - 3} more"
             if not scouts_list:
@@ -773,17 +808,17 @@ class ReportGenerator:
             # Show MBC name or 'None' per Pass 4 feedback
             mbc_name = "None"
             if gap['counselors']:
-                mbc_name = gap['counselors'][0]['name']  # Show first counselor name
+                mbc_name = _escape_text(gap['counselors'][0]['name'])  # Show first counselor name
 
-            html += f"""
+            yield f"""
                     <tr class="critical-row">
-                        <td><strong>{eagle_indicator}{gap['badge_name']}</strong></td>
+                        <td><strong>{eagle_indicator}{_escape_text(gap['badge_name'])}</strong></td>
                         <td class="number">{gap['scout_demand']}</td>
                         <td>{scouts_list}</td>
                         <td>{mbc_name}</td>
                     </tr>"""
 
-        html += f"""
+        yield f"""
                 </tbody>
             </table>
         </div>
@@ -807,20 +842,20 @@ class ReportGenerator:
         sorted_high_gaps = sorted(high_gaps, key=lambda x: x['badge_name'])
         for gap in sorted_high_gaps:
             eagle_indicator = "🦅 " if gap['is_eagle_required'] else ""
-            scouts_list = ", ".join(gap['interested_scouts'][:3])  # Show first 3 scouts
+            scouts_list = ", ".join(map(_escape_text, gap['interested_scouts'][:3]))  # Show first 3 scouts
             if len(gap['interested_scouts']) > 3:
                 scouts_list += f" +{len(gap['interested_scouts']) - 3} more"
             if not scouts_list:
                 scouts_list = "None currently"
 
-            html += f"""
+            yield f"""
                     <tr class="high-row">
-                        <td><strong>{eagle_indicator}{gap['badge_name']}</strong></td>
+                        <td><strong>{eagle_indicator}{_escape_text(gap['badge_name'])}</strong></td>
                         <td class="number">{gap['scout_demand']}</td>
                         <td>{scouts_list}</td>
                     </tr>"""
 
-        html += f"""
+        yield f"""
                 </tbody>
             </table>
         </div>
@@ -836,23 +871,23 @@ class ReportGenerator:
         sorted_medium_gaps = sorted(medium_gaps, key=lambda x: x['badge_name'])
         for priority in sorted_medium_gaps:
             eagle_indicator = "🦅" if priority['is_eagle_required'] else ""
-            scouts_list = ", ".join(priority['interested_scouts'][:3])  # Show first 3 scouts
+            scouts_list = ", ".join(map(_escape_text, priority['interested_scouts'][:3]))  # Show first 3 scouts
             if len(priority['interested_scouts']) > 3:
                 scouts_list += f" +{len(priority['interested_scouts']) - 3} more"
             if not scouts_list:
                 scouts_list = "None currently"
 
-            html += f"""
+            yield f"""
                 <div class="priority-item medium">
                     <div class="priority-details">
-                        <div class="badge-name">{eagle_indicator}{priority['badge_name']}</div>
+                        <div class="badge-name">{eagle_indicator}{_escape_text(priority['badge_name'])}</div>
                         <div class="priority-meta">
                             {priority['scout_demand']} Scout(s) interested: {scouts_list}
                         </div>
                     </div>
                 </div>"""
 
-        html += f"""
+        yield f"""
             </div>
         </div>
 
@@ -960,50 +995,84 @@ class ReportGenerator:
 </body>
 </html>"""
 
-        return html
+    def generate_troop_counselors_report(self, data: Dict) -> str:
+        """Generate troop counselors HTML report"""
+        return ''.join(self.iter_troop_counselors_report(data))
 
-    async def generate_pdf_from_html_async(self, html_file: Path) -> Path:
-        """Generate PDF from HTML file using Playwright"""
+    def generate_non_counselors_report(self, data: Dict) -> str:
+        """Generate non-counselor leaders HTML report"""
+        return ''.join(self.iter_non_counselors_report(data))
+
+    def generate_coverage_report(self, data: Dict) -> str:
+        """Generate merit badge coverage report matching legacy format"""
+        return ''.join(self.iter_coverage_report(data))
+
+    def generate_priority_report(self, priority_data: Dict) -> str:
+        """Generate priority coverage analysis report with Scout demand data"""
+        return ''.join(self.iter_priority_report(priority_data))
+
+    async def _print_pdf(self, browser, html_file: Path) -> Optional[Path]:
+        """Print one HTML file to PDF in its own page of an already launched browser"""
         try:
-            from playwright.async_api import async_playwright
-            
             pdf_file = html_file.with_suffix('.pdf')
+            page = await browser.new_page()
             
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-                
-                # Load the HTML file
-                await page.goto(f"file://{html_file.absolute()}")
-                
-                # Generate PDF with full color and good formatting
-                await page.pdf(
-                    path=str(pdf_file),
-                    format='Letter',
-                    margin={
-                        'top': '0.75in',
-                        'right': '0.75in', 
-                        'bottom': '0.75in',
-                        'left': '0.75in'
-                    },
-                    print_background=True,  # Include background colors and images
-                    prefer_css_page_size=False
-                )
-                
-                await browser.close()
-                
+            # Load the HTML file
+            await page.goto(f"file://{html_file.absolute()}")
+            
+            # Generate PDF with full color and good formatting
+            await page.pdf(
+                path=str(pdf_file),
+                format='Letter',
+                margin={
+                    'top': '0.75in',
+                    'right': '0.75in', 
+                    'bottom': '0.75in',
+                    'left': '0.75in'
+                },
+                print_background=True,  # Include background colors and images
+                prefer_css_page_size=False
+            )
+            
+            await page.close()
             print(f"📄 Generated PDF: {pdf_file.name}")
             return pdf_file
             
-        except ImportError:
-            print(f"⚠️ Playwright not available. Skipping PDF generation for {html_file.name}")
-            print("   Install with: pip install playwright && playwright install chromium")
-            return None
         except Exception as e:
             print(f"❌ PDF generation failed for {html_file.name}: {str(e)}")
             return None
     
-    def generate_pdf_from_html(self, html_file: Path) -> Path:
+    async def generate_pdfs_from_html_async(self, html_files: List[Path]) -> List[Optional[Path]]:
+        """Generate PDFs from HTML files using Playwright - one browser, all pages printed concurrently"""
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            for html_file in html_files:
+                print(f"⚠️ Playwright not available. Skipping PDF generation for {html_file.name}")
+            print("   Install with: pip install playwright && playwright install chromium")
+            return [None] * len(html_files)
+        
+        try:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=True)
+                pdf_files = await asyncio.gather(*(self._print_pdf(browser, html_file) for html_file in html_files))
+                await browser.close()
+            return list(pdf_files)
+            
+        except Exception as e:
+            for html_file in html_files:
+                print(f"❌ PDF generation failed for {html_file.name}: {str(e)}")
+            return [None] * len(html_files)
+    
+    async def generate_pdf_from_html_async(self, html_file: Path) -> Optional[Path]:
+        """Generate PDF from HTML file using Playwright"""
+        return (await self.generate_pdfs_from_html_async([html_file]))[0]
+    
+    def generate_pdfs_from_html(self, html_files: List[Path]) -> List[Optional[Path]]:
+        """Synchronous wrapper for batch PDF generation"""
+        return asyncio.run(self.generate_pdfs_from_html_async(html_files))
+    
+    def generate_pdf_from_html(self, html_file: Path) -> Optional[Path]:
         """Synchronous wrapper for PDF generation"""
         return asyncio.run(self.generate_pdf_from_html_async(html_file))
     
@@ -1014,28 +1083,36 @@ class ReportGenerator:
         # Load data
         data = self.load_data()
 
-        # Generate reports with new filename format
+        # Reports with new filename format - each is built lazily while it is written
         troop_filename_prefix = "_".join(self.troop_abbrevs)
         reports = {
-            f'{troop_filename_prefix}_MBC_Troop_Counselors_{self.timestamp}.html': self.generate_troop_counselors_report(data),
-            f'{troop_filename_prefix}_MBC_Non_Counselors_{self.timestamp}.html': self.generate_non_counselors_report(data),
-            f'{troop_filename_prefix}_MBC_Coverage_Report_{self.timestamp}.html': self.generate_coverage_report(data)
+            f'{troop_filename_prefix}_MBC_Troop_Counselors_{self.timestamp}.html': self.iter_troop_counselors_report(data),
+            f'{troop_filename_prefix}_MBC_Non_Counselors_{self.timestamp}.html': self.iter_non_counselors_report(data),
+            f'{troop_filename_prefix}_MBC_Coverage_Report_{self.timestamp}.html': self.iter_coverage_report(data)
         }
 
         # Generate priority report if priority data is available
         priority_data = self.load_priority_data()
         if priority_data:
-            reports[f'{troop_filename_prefix}_MBC_Priority_Report_{self.timestamp}.html'] = self.generate_priority_report(priority_data)
+            reports[f'{troop_filename_prefix}_MBC_Priority_Report_{self.timestamp}.html'] = self.iter_priority_report(priority_data)
         
-        # Save HTML reports and generate PDFs
-        for filename, content in reports.items():
+        # Stream HTML reports to a temp file, renamed into place only once fully built
+        html_files = []
+        for filename, fragments in reports.items():
             output_file = self.output_dir / filename
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            tmp_file = output_file.with_suffix('.html.tmp')
+            try:
+                with open(tmp_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.writelines(fragments)
+                os.replace(tmp_file, output_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
             print(f"✅ Generated {filename}")
-            
-            # Generate PDF version
-            self.generate_pdf_from_html(output_file)
+            html_files.append(output_file)
+        
+        # Generate PDF versions together, sharing one browser launch
+        self.generate_pdfs_from_html(html_files)
         
         # Generate summary JSON with filtered counts
         filtered_counselors = self.filter_excluded_names(data['troop_counselors'])
@@ -528,7 +528,7 @@ def main():
         print(f"❌ MBC data file not found: {mbc_file}")
         return
 
-    with open(mbc_file, 'r') as f:
+    with open(mbc_file, 'r', encoding='utf-8') as f:
         mbc_data = json.load(f)
 
     print(f"📖 Loaded {len(mbc_data.get('counselors', []))} Merit Badge Counselors from {mbc_file}")